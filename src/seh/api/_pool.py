@@ -0,0 +1,115 @@
+"""Process-wide HTTP connection pool for the SolarEdge API."""
+
+import asyncio
+import atexit
+
+import httpx
+
+from seh.config.settings import Settings
+
+_CLIENT: httpx.AsyncClient | None = None
+_CLIENT_KEY: tuple[str, str, int, int] | None = None
+_CLIENT_LOOP: asyncio.AbstractEventLoop | None = None
+
+
+def _client_key(settings: Settings) -> tuple[str, str, int, int]:
+    """Get the settings that determine how the shared client is built."""
+    return (
+        settings.api_base_url.rstrip("/"),
+        settings.api_key.get_secret_value(),
+        settings.api_timeout,
+        settings.api_max_concurrent,
+    )
+
+
+def _accept_encoding() -> str:
+    """Get the Accept-Encoding header value the installed decoders support.
+
+    httpx only decodes brotli when the brotli (or brotlicffi) package is
+    installed, so "br" is advertised only in that case.
+    """
+    for module in ("brotli", "brotlicffi"):
+        try:
+            __import__(module)
+        except ImportError:
+            continue
+        return "br, gzip"
+    return "gzip"
+
+
+def _build_client(settings: Settings) -> httpx.AsyncClient:
+    """Build an AsyncClient tuned for the SolarEdge API.
+
+    All endpoints live on a single origin, so the keep-alive pool is sized
+    relative to the concurrency limit and HTTP/2 multiplexes requests. The
+    API key is sent as a default query parameter on every request.
+    """
+    max_concurrent = settings.api_max_concurrent
+    return httpx.AsyncClient(
+        base_url=settings.api_base_url.rstrip("/"),
+        params={"api_key": settings.api_key.get_secret_value()},
+        timeout=settings.api_timeout,
+        limits=httpx.Limits(
+            max_keepalive_connections=max_concurrent * 2,
+            max_connections=max_concurrent * 4,
+            keepalive_expiry=30.0,
+        ),
+        http2=True,
+        headers={"Accept-Encoding": _accept_encoding()},
+    )
+
+
+async def get_client(settings: Settings) -> httpx.AsyncClient:
+    """Get the shared AsyncClient, creating it on first use.
+
+    Pooled connections are bound to the event loop that opened them, so a
+    new client is built when called from a different loop or with settings
+    that change how the client is configured.
+
+    Args:
+        settings: Application settings.
+
+    Returns:
+        Shared HTTP client.
+    """
+    global _CLIENT, _CLIENT_KEY, _CLIENT_LOOP
+
+    loop = asyncio.get_running_loop()
+    key = _client_key(settings)
+
+    if _CLIENT is not None and (
+        _CLIENT.is_closed or _CLIENT_LOOP is not loop or key != _CLIENT_KEY
+    ):
+        if _CLIENT_LOOP is loop and not _CLIENT.is_closed:
+            await _CLIENT.aclose()
+        _CLIENT = None
+
+    if _CLIENT is None:
+        _CLIENT = _build_client(settings)
+        _CLIENT_KEY = key
+        _CLIENT_LOOP = loop
+
+    return _CLIENT
+
+
+async def close_client() -> None:
+    """Close the shared AsyncClient if it is open."""
+    global _CLIENT, _CLIENT_KEY, _CLIENT_LOOP
+
+    if _CLIENT is not None and not _CLIENT.is_closed:
+        await _CLIENT.aclose()
+    _CLIENT = None
+    _CLIENT_KEY = None
+    _CLIENT_LOOP = None
+
+
+def _close_at_exit() -> None:
+    """Close the shared client at interpreter shutdown if its loop is usable."""
+    if _CLIENT is None or _CLIENT.is_closed or _CLIENT_LOOP is None:
+        return
+    if _CLIENT_LOOP.is_closed() or _CLIENT_LOOP.is_running():
+        return
+    _CLIENT_LOOP.run_until_complete(close_client())
+
+
+atexit.register(_close_at_exit)
@@ -0,0 +1,139 @@
+"""On-disk HTTP response cache for rarely changing SolarEdge endpoints."""
+
+import hashlib
+import os
+import re
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import orjson
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Endpoints whose responses change rarely (site metadata, equipment lists).
+# Only requests to these paths without query parameters are cached.
+STATIC_PATH_RE = re.compile(
+    r"^/(?:sites/list"
+    r"|site/\d+/(?:details|inventory|envBenefits|meters)"
+    r"|equipment/\d+/list)$"
+)
+
+
+def is_static_path(path: str) -> bool:
+    """Check whether an API path is a cacheable static endpoint.
+
+    Args:
+        path: API path.
+
+    Returns:
+        True if responses for the path may be cached.
+    """
+    return STATIC_PATH_RE.match(path) is not None
+
+
+@dataclass
+class CacheEntry:
+    """A cached API response with its validators."""
+
+    data: dict[str, Any]
+    stored_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def is_fresh(self, ttl: float) -> bool:
+        """Check whether the entry is younger than the TTL."""
+        return time.time() - self.stored_at < ttl
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Get revalidation headers for an expired entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """File-backed cache of JSON API responses keyed by API key and path."""
+
+    def __init__(self, cache_dir: str, api_key: str, ttl: float = 3600.0) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory to store cached responses in.
+            api_key: API key, mixed into cache keys so accounts never share entries.
+            ttl: Seconds a cached response is served without revalidation.
+        """
+        self._dir = Path(cache_dir).expanduser()
+        self._api_key = api_key
+        self.ttl = ttl
+
+    def _file_for(self, path: str) -> Path:
+        """Get the cache file for an API path."""
+        digest = hashlib.sha256(f"{self._api_key}:{path}".encode()).hexdigest()
+        return self._dir / f"{digest}.json"
+
+    def get(self, path: str) -> CacheEntry | None:
+        """Load a cached response.
+
+        Args:
+            path: API path.
+
+        Returns:
+            Cache entry or None if missing or unreadable.
+        """
+        try:
+            raw = orjson.loads(self._file_for(path).read_bytes())
+            return CacheEntry(
+                data=raw["data"],
+                stored_at=raw["stored_at"],
+                etag=raw.get("etag"),
+                last_modified=raw.get("last_modified"),
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def set(
+        self,
+        path: str,
+        data: dict[str, Any],
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a response, replacing any existing entry atomically.
+
+        Args:
+            path: API path.
+            data: Parsed JSON response.
+            etag: ETag response header, if any.
+            last_modified: Last-Modified response header, if any.
+        """
+        payload = orjson.dumps({
+            "data": data,
+            "stored_at": time.time(),
+            "etag": etag,
+            "last_modified": last_modified,
+        })
+        target = self._file_for(path)
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self._dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, target)
+        except OSError as e:
+            logger.warning("Failed to write response cache", path=path, error=str(e))
+
+    def touch(self, entry: CacheEntry, path: str) -> None:
+        """Mark a revalidated entry as fresh again.
+
+        Args:
+            entry: Entry confirmed unchanged by the server.
+            path: API path.
+        """
+        self.set(path, entry.data, entry.etag, entry.last_modified)
@@ -1,17 +1,169 @@
 """SolarEdge API client."""
 
-from datetime import date, datetime
+import asyncio
+import copy
+import logging
+import time
+from collections.abc import AsyncIterator, Iterator
+from datetime import UTC, date, datetime
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from typing import Any
 
 import httpx
+import orjson
 import structlog
 
+from seh.api._pool import get_client
+from seh.api.cache import ResponseCache, is_static_path
+from seh.api.models.responses import BATTERY_TELEMETRY_ADAPTER, BatteryTelemetry
 from seh.api.rate_limiter import RateLimiter
 from seh.config.settings import Settings
 from seh.utils.exceptions import APIError
 from seh.utils.retry import retry_with_backoff
 
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
 logger = structlog.get_logger(__name__)
+# Backing stdlib logger, used to skip building debug events when filtered out
+_stdlib_logger = logging.getLogger(__name__)
+
+# How long identical static-endpoint requests are answered from the in-memory memo
+_MEMO_TTL = 3600.0
+
+
+# Chunk size used when streaming large response bodies
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Bodies larger than this are parsed in a worker thread so a multi-MB
+# decode does not stall other requests on the event loop
+_OFFLOAD_PARSE_BYTES = 256 * 1024
+
+# Largest body buffered in memory when ijson is unavailable for streaming
+_MAX_BUFFERED_BYTES = 64 * 1024 * 1024
+
+# List endpoints: name -> (path template, outer key, inner key).
+# The API returns a bare dict instead of a one-element list for single items.
+_LIST_ENDPOINTS: dict[str, tuple[str, str, str]] = {
+    "sites": ("/sites/list", "sites", "site"),
+    "equipment": ("/equipment/{site_id}/list", "reporters", "list"),
+    "telemetries": ("/equipment/{site_id}/{serial_number}/data", "data", "telemetries"),
+    "energy": ("/site/{site_id}/energy", "energy", "values"),
+    "power": ("/site/{site_id}/power", "power", "values"),
+    "meters": ("/site/{site_id}/meters", "metersList", "meters"),
+    "alerts": ("/site/{site_id}/alerts", "alerts", "alert"),
+}
+
+
+def _iter_prefix(node: Any, prefix: str) -> Iterator[Any]:
+    """Yield the items an ijson-style prefix selects from parsed JSON.
+
+    Args:
+        node: Parsed JSON value.
+        prefix: Dotted path where "item" iterates over a list.
+
+    Yields:
+        Matching values.
+    """
+    if not prefix:
+        yield node
+        return
+    head, _, rest = prefix.partition(".")
+    if head == "item":
+        for child in node if isinstance(node, list) else []:
+            yield from _iter_prefix(child, rest)
+    elif isinstance(node, dict) and head in node:
+        yield from _iter_prefix(node[head], rest)
+
+
+def _aslist(value: Any) -> tuple[Any, ...]:
+    """Normalize a list field that the API returns as a bare object when singular.
+
+    Args:
+        value: List, single dictionary, or None.
+
+    Returns:
+        Tuple of items.
+    """
+    if isinstance(value, dict):
+        return (value,)
+    return tuple(value) if value else ()
+
+
+async def _parse_json(content: bytes | bytearray) -> Any:
+    """Parse a JSON body, off the event loop when it is large.
+
+    Args:
+        content: Raw response body.
+
+    Returns:
+        Parsed JSON value.
+    """
+    if len(content) < _OFFLOAD_PARSE_BYTES:
+        return orjson.loads(content)
+    return await asyncio.to_thread(orjson.loads, content)
+
+
+def _body_snippet(response: httpx.Response, limit: int) -> str:
+    """Decode the start of a response body for logs and error messages.
+
+    Slicing the bytes first avoids decoding large HTML error pages in full.
+
+    Args:
+        response: HTTP response with its body read.
+        limit: Maximum number of bytes to decode.
+
+    Returns:
+        Decoded body prefix.
+    """
+    return response.content[:limit].decode("utf-8", errors="replace")
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Parse the Retry-After header of a response.
+
+    Args:
+        response: HTTP response.
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid.
+    """
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+
+def _format_api_date(d: date | datetime) -> str:
+    """Format a date or datetime the way the API expects."""
+    if isinstance(d, datetime):
+        # The API takes local wall-clock time without an offset. The offset
+        # is dropped before the cache lookup, because aware datetimes for the
+        # same instant in different zones compare equal.
+        return _format_wall_clock(d.replace(tzinfo=None))
+    return d.isoformat()
+
+
+@lru_cache(maxsize=1024)
+def _format_wall_clock(d: datetime) -> str:
+    """Format a naive datetime for the API.
+
+    Sync windows repeat across sites, so results are cached.
+    """
+    return d.isoformat(sep=" ", timespec="seconds")
 
 
 class SolarEdgeClient:
@@ -32,17 +184,44 @@ class SolarEdgeClient:
             daily_limit=settings.api_daily_limit,
         )
         self._client: httpx.AsyncClient | None = None
+        self._memo: dict[tuple[Any, ...], tuple[float, dict[str, Any]]] = {}
+        self._url_cache: dict[tuple[Any, ...], str] = {}
+        self._cache: ResponseCache | None = None
+        if settings.api_cache_dir:
+            self._cache = ResponseCache(
+                settings.api_cache_dir,
+                self._api_key,
+                ttl=settings.api_cache_ttl,
+            )
 
     async def __aenter__(self) -> "SolarEdgeClient":
         """Context manager entry."""
-        self._client = httpx.AsyncClient(timeout=self._timeout)
+        self._client = await get_client(self._settings)
         return self
 
     async def __aexit__(self, *args: Any) -> None:
-        """Context manager exit."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Context manager exit.
+
+        The underlying HTTP client is shared across SolarEdgeClient instances
+        and is closed at interpreter shutdown, not here.
+        """
+        self._client = None
+
+    def _p(self, site_id: int, suffix: str) -> str:
+        """Get the path for a per-site endpoint, reusing previously built paths.
+
+        Args:
+            site_id: Site ID.
+            suffix: Endpoint name after the site ID (e.g. "details").
+
+        Returns:
+            API path.
+        """
+        key = (site_id, suffix)
+        path = self._url_cache.get(key)
+        if path is None:
+            path = self._url_cache[key] = f"/site/{site_id}/{suffix}"
+        return path
 
     def _format_date(self, d: date | datetime | None) -> str | None:
         """Format a date for the API.
@@ -55,11 +234,8 @@ class SolarEdgeClient:
         """
         if d is None:
             return None
-        if isinstance(d, datetime):
-            return d.strftime("%Y-%m-%d %H:%M:%S")
-        return d.strftime("%Y-%m-%d")
+        return _format_api_date(d)
 
-    @retry_with_backoff(max_retries=3, base_delay=2.0)
     async def _request(
         self,
         method: str,
@@ -69,7 +245,8 @@ class SolarEdgeClient:
         """Make an API request.
 
         Args:
-            method: HTTP method.
+            method: HTTP method. The SolarEdge API is read-only, so only GET
+                is supported.
             path: API path.
             params: Query parameters.
 
@@ -78,50 +255,221 @@ class SolarEdgeClient:
 
         Raises:
             APIError: If the request fails.
+            ValueError: If method is not GET.
         """
+        if method != "GET":
+            raise ValueError(f"Unsupported HTTP method: {method}")
         if not self._client:
             raise APIError("Client not initialized. Use 'async with' context manager.")
+        return await self._send(path, params)
+
+    def _remember(self, key: tuple[Any, ...], data: dict[str, Any]) -> None:
+        """Memoize a static-endpoint response, dropping expired entries.
 
-        url = f"{self._base_url}{path}"
-        params = params or {}
-        params["api_key"] = self._api_key
+        The memo keeps its own copy; the caller keeps the object it was given.
+
+        Args:
+            key: Memo key built from the path and query parameters.
+            data: Parsed JSON response.
+        """
+        now = time.monotonic()
+        expired = [k for k, (stored, _) in self._memo.items() if now - stored >= _MEMO_TTL]
+        for k in expired:
+            del self._memo[k]
+        self._memo[key] = (now, copy.deepcopy(data))
+
+    @retry_with_backoff(max_retries=3, base_delay=2.0)
+    async def _send(
+        self,
+        path: str,
+        params: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        """Send a GET request, retrying transient failures.
+
+        Args:
+            path: API path.
+            params: Query parameters.
+
+        Returns:
+            JSON response data.
+
+        Raises:
+            APIError: If the request fails.
+        """
+        # Only static endpoints are memoized; date-window requests never repeat
+        static = is_static_path(path)
+        memo_key = (path, tuple(sorted(params.items())) if params else ())
+        if static:
+            memo = self._memo.get(memo_key)
+            if memo and time.monotonic() - memo[0] < _MEMO_TTL:
+                # Repeated call within this run; copy so callers cannot alter the memo
+                return copy.deepcopy(memo[1])
+
+        cache_entry = None
+        cache = self._cache if not params and static else None
+        if cache is not None:
+            cache_entry = cache.get(path)
+            if cache_entry and cache_entry.is_fresh(cache.ttl):
+                # Served locally, so it does not count against the daily quota
+                if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("API cache hit", path=path)
+                self._remember(memo_key, cache_entry.data)
+                return cache_entry.data
+
+        headers = cache_entry.conditional_headers() if cache_entry else None
 
         async with self._rate_limiter:
-            logger.debug("API request", method=method, path=path)
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                logger.debug("API request", path=path)
 
+            # _request checks the client before the first attempt
+            assert self._client is not None
             try:
-                response = await self._client.request(method, url, params=params)
+                response = await self._client.get(path, params=params, headers=headers)
+                not_modified = response.status_code == httpx.codes.NOT_MODIFIED
+                if cache is not None and cache_entry and not_modified:
+                    cache.touch(cache_entry, path)
+                    self._remember(memo_key, cache_entry.data)
+                    return cache_entry.data
                 response.raise_for_status()
-                return response.json()
+                data = await _parse_json(response.content)
+                if cache is not None:
+                    cache.set(
+                        path,
+                        data,
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                    )
+                if static:
+                    self._remember(memo_key, data)
+                return data
+            except httpx.HTTPStatusError as e:
+                logger.error(
+                    "API error",
+                    status_code=e.response.status_code,
+                    path=path,
+                    response=_body_snippet(e.response, 500),
+                )
+                raise APIError(
+                    f"API request failed: {_body_snippet(e.response, 200)}",
+                    status_code=e.response.status_code,
+                    retry_after=_retry_after(e.response),
+                ) from e
+            except httpx.RequestError as e:
+                logger.error("Request error", path=path, error=str(e))
+                raise APIError(f"Request failed: {e}") from e
+
+    async def _request_stream(
+        self,
+        path: str,
+        params: dict[str, Any] | None,
+        prefix: str,
+    ) -> AsyncIterator[Any]:
+        """Stream items from a large GET response as the body arrives.
+
+        Uses ijson to parse the body incrementally when it is installed;
+        otherwise the body is buffered, up to a size limit, and parsed in
+        one go. Streamed requests
+        bypass the memo and response cache and are not retried.
+
+        Args:
+            path: API path.
+            params: Query parameters.
+            prefix: ijson prefix selecting the items to yield.
+
+        Yields:
+            Parsed items under the prefix.
+
+        Raises:
+            APIError: If the request fails.
+        """
+        if not self._client:
+            raise APIError("Client not initialized. Use 'async with' context manager.")
+
+        async with self._rate_limiter:
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                logger.debug("API stream request", path=path)
+
+            try:
+                async with self._client.stream("GET", path, params=params) as response:
+                    if response.is_error:
+                        await response.aread()
+                        response.raise_for_status()
+
+                    if ijson is None:
+                        body = bytearray()
+                        async for chunk in response.aiter_bytes(_STREAM_CHUNK_SIZE):
+                            body += chunk
+                            if len(body) > _MAX_BUFFERED_BYTES:
+                                raise APIError(
+                                    f"Response for {path} exceeds "
+                                    f"{_MAX_BUFFERED_BYTES} bytes; install ijson "
+                                    "to stream it"
+                                )
+                        data = await _parse_json(body)
+                        for item in _iter_prefix(data, prefix):
+                            yield item
+                        return
+
+                    items = ijson.sendable_list()
+                    parser = ijson.items_coro(items, prefix, use_float=True)
+                    async for chunk in response.aiter_bytes(_STREAM_CHUNK_SIZE):
+                        parser.send(chunk)
+                        for item in items:
+                            yield item
+                        del items[:]
+                    parser.close()
+                    for item in items:
+                        yield item
             except httpx.HTTPStatusError as e:
                 logger.error(
                     "API error",
                     status_code=e.response.status_code,
-                    url=url,
-                    response=e.response.text[:500],
+                    path=path,
+                    response=_body_snippet(e.response, 500),
                 )
                 raise APIError(
-                    f"API request failed: {e.response.text[:200]}",
+                    f"API request failed: {_body_snippet(e.response, 200)}",
                     status_code=e.response.status_code,
+                    retry_after=_retry_after(e.response),
                 ) from e
             except httpx.RequestError as e:
-                logger.error("Request error", url=url, error=str(e))
+                logger.error("Request error", path=path, error=str(e))
                 raise APIError(f"Request failed: {e}") from e
 
+    async def _get_list(
+        self,
+        key: str,
+        params: dict[str, Any] | None = None,
+        **path_args: Any,
+    ) -> tuple[dict[str, Any], ...]:
+        """Fetch a list endpoint and normalize its items to a tuple.
+
+        Args:
+            key: Name of the endpoint in _LIST_ENDPOINTS.
+            params: Query parameters.
+            **path_args: Values for the path template placeholders.
+
+        Returns:
+            Tuple of item dictionaries.
+        """
+        template, outer, inner = _LIST_ENDPOINTS[key]
+        url_key = (key, *path_args.values())
+        path = self._url_cache.get(url_key)
+        if path is None:
+            path = self._url_cache[url_key] = template.format_map(path_args)
+        data = await self._request("GET", path, params=params)
+        return _aslist((data.get(outer) or {}).get(inner))
+
     # Site endpoints
 
-    async def get_sites(self) -> list[dict[str, Any]]:
+    async def get_sites(self) -> tuple[dict[str, Any], ...]:
         """Get list of sites for the account.
 
         Returns:
-            List of site data dictionaries.
+            Tuple of site data dictionaries.
         """
-        data = await self._request("GET", "/sites/list")
-        sites = data.get("sites", {}).get("site", [])
-        # Ensure it's a list (single site returns dict)
-        if isinstance(sites, dict):
-            sites = [sites]
-        return sites
+        return await self._get_list("sites")
 
     async def get_site_details(self, site_id: int) -> dict[str, Any]:
         """Get detailed information for a site.
@@ -132,25 +480,21 @@ class SolarEdgeClient:
         Returns:
             Site details dictionary.
         """
-        data = await self._request("GET", f"/site/{site_id}/details")
+        data = await self._request("GET", self._p(site_id, "details"))
         return data.get("details", {})
 
     # Equipment endpoints
 
-    async def get_equipment(self, site_id: int) -> list[dict[str, Any]]:
+    async def get_equipment(self, site_id: int) -> tuple[dict[str, Any], ...]:
         """Get list of equipment at a site.
 
         Args:
             site_id: Site ID.
 
         Returns:
-            List of equipment (inverters).
+            Tuple of equipment (inverters).
         """
-        data = await self._request("GET", f"/equipment/{site_id}/list")
-        reporters = data.get("reporters", {}).get("list", [])
-        if isinstance(reporters, dict):
-            reporters = [reporters]
-        return reporters
+        return await self._get_list("equipment", site_id=site_id)
 
     async def get_inverter_data(
         self,
@@ -158,7 +502,7 @@ class SolarEdgeClient:
         serial_number: str,
         start_time: datetime,
         end_time: datetime,
-    ) -> list[dict[str, Any]]:
+    ) -> tuple[dict[str, Any], ...]:
         """Get inverter telemetry data.
 
         Args:
@@ -168,17 +512,17 @@ class SolarEdgeClient:
             end_time: End time.
 
         Returns:
-            List of telemetry readings.
+            Tuple of telemetry readings.
         """
-        data = await self._request(
-            "GET",
-            f"/equipment/{site_id}/{serial_number}/data",
+        return await self._get_list(
+            "telemetries",
             params={
                 "startTime": self._format_date(start_time),
                 "endTime": self._format_date(end_time),
             },
+            site_id=site_id,
+            serial_number=serial_number,
         )
-        return data.get("data", {}).get("telemetries", [])
 
     async def get_optimizer_data(
         self,
@@ -186,7 +530,7 @@ class SolarEdgeClient:
         serial_number: str,
         start_time: datetime,
         end_time: datetime,
-    ) -> list[dict[str, Any]]:
+    ) -> tuple[dict[str, Any], ...]:
         """Get optimizer telemetry data.
 
         Args:
@@ -196,17 +540,17 @@ class SolarEdgeClient:
             end_time: End time.
 
         Returns:
-            List of telemetry readings.
+            Tuple of telemetry readings.
         """
-        data = await self._request(
-            "GET",
-            f"/equipment/{site_id}/{serial_number}/data",
+        return await self._get_list(
+            "telemetries",
             params={
                 "startTime": self._format_date(start_time),
                 "endTime": self._format_date(end_time),
             },
+            site_id=site_id,
+            serial_number=serial_number,
         )
-        return data.get("data", {}).get("telemetries", [])
 
     # Energy endpoints
 
@@ -216,7 +560,7 @@ class SolarEdgeClient:
         start_date: date,
         end_date: date,
         time_unit: str = "DAY",
-    ) -> list[dict[str, Any]]:
+    ) -> tuple[dict[str, Any], ...]:
         """Get energy production data.
 
         Args:
@@ -226,18 +570,17 @@ class SolarEdgeClient:
             time_unit: Time unit (DAY, WEEK, MONTH, YEAR).
 
         Returns:
-            List of energy values.
+            Tuple of energy values.
         """
-        data = await self._request(
-            "GET",
-            f"/site/{site_id}/energy",
+        return await self._get_list(
+            "energy",
             params={
                 "startDate": self._format_date(start_date),
                 "endDate": self._format_date(end_date),
                 "timeUnit": time_unit,
             },
+            site_id=site_id,
         )
-        return data.get("energy", {}).get("values", [])
 
     async def get_energy_details(
         self,
@@ -259,7 +602,7 @@ class SolarEdgeClient:
         """
         data = await self._request(
             "GET",
-            f"/site/{site_id}/energyDetails",
+            self._p(site_id, "energyDetails"),
             params={
                 "startTime": self._format_date(start_time),
                 "endTime": self._format_date(end_time),
@@ -268,6 +611,38 @@ class SolarEdgeClient:
         )
         return data.get("energyDetails", {})
 
+    async def get_energy_details_iter(
+        self,
+        site_id: int,
+        start_time: datetime,
+        end_time: datetime,
+        time_unit: str = "QUARTER_OF_AN_HOUR",
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream detailed energy data one meter at a time.
+
+        Long QUARTER_OF_AN_HOUR ranges can return multi-megabyte payloads;
+        this avoids holding the raw body and the parsed result together.
+
+        Args:
+            site_id: Site ID.
+            start_time: Start time.
+            end_time: End time.
+            time_unit: Time unit (QUARTER_OF_AN_HOUR, HOUR, DAY, WEEK, MONTH, YEAR).
+
+        Yields:
+            Meter dictionaries with "type" and "values" keys.
+        """
+        async for meter in self._request_stream(
+            self._p(site_id, "energyDetails"),
+            params={
+                "startTime": self._format_date(start_time),
+                "endTime": self._format_date(end_time),
+                "timeUnit": time_unit,
+            },
+            prefix="energyDetails.meters.item",
+        ):
+            yield meter
+
     # Power endpoints
 
     async def get_power(
@@ -275,7 +650,7 @@ class SolarEdgeClient:
         site_id: int,
         start_time: datetime,
         end_time: datetime,
-    ) -> list[dict[str, Any]]:
+    ) -> tuple[dict[str, Any], ...]:
         """Get power production data.
 
         Args:
@@ -284,17 +659,16 @@ class SolarEdgeClient:
             end_time: End time.
 
         Returns:
-            List of power values.
+            Tuple of power values.
         """
-        data = await self._request(
-            "GET",
-            f"/site/{site_id}/power",
+        return await self._get_list(
+            "power",
             params={
                 "startTime": self._format_date(start_time),
                 "endTime": self._format_date(end_time),
             },
+            site_id=site_id,
         )
-        return data.get("power", {}).get("values", [])
 
     async def get_power_details(
         self,
@@ -314,7 +688,7 @@ class SolarEdgeClient:
         """
         data = await self._request(
             "GET",
-            f"/site/{site_id}/powerDetails",
+            self._p(site_id, "powerDetails"),
             params={
                 "startTime": self._format_date(start_time),
                 "endTime": self._format_date(end_time),
@@ -331,7 +705,7 @@ class SolarEdgeClient:
         Returns:
             Power flow dictionary.
         """
-        data = await self._request("GET", f"/site/{site_id}/currentPowerFlow")
+        data = await self._request("GET", self._p(site_id, "currentPowerFlow"))
         return data.get("siteCurrentPowerFlow", {})
 
     # Storage endpoints
@@ -354,7 +728,7 @@ class SolarEdgeClient:
         """
         data = await self._request(
             "GET",
-            f"/site/{site_id}/storageData",
+            self._p(site_id, "storageData"),
             params={
                 "startTime": self._format_date(start_time),
                 "endTime": self._format_date(end_time),
@@ -362,22 +736,41 @@ class SolarEdgeClient:
         )
         return data.get("storageData", {})
 
+    async def get_storage_data_typed(
+        self,
+        site_id: int,
+        start_time: datetime,
+        end_time: datetime,
+    ) -> list[BatteryTelemetry]:
+        """Get storage (battery) data as validated models.
+
+        Args:
+            site_id: Site ID.
+            start_time: Start time.
+            end_time: End time.
+
+        Returns:
+            List of batteries with their telemetry samples.
+        """
+        storage_data = await self.get_storage_data(site_id, start_time, end_time)
+        # Long ranges hold thousands of samples; validate off the event loop
+        return await asyncio.to_thread(
+            BATTERY_TELEMETRY_ADAPTER.validate_python,
+            storage_data.get("batteries") or [],
+        )
+
     # Meter endpoints
 
-    async def get_meters(self, site_id: int) -> list[dict[str, Any]]:
+    async def get_meters(self, site_id: int) -> tuple[dict[str, Any], ...]:
         """Get list of meters at a site.
 
         Args:
             site_id: Site ID.
 
         Returns:
-            List of meter info.
+            Tuple of meter info.
         """
-        data = await self._request("GET", f"/site/{site_id}/meters")
-        meters = data.get("metersList", {}).get("meters", [])
-        if isinstance(meters, dict):
-            meters = [meters]
-        return meters
+        return await self._get_list("meters", site_id=site_id)
 
     async def get_meter_data(
         self,
@@ -397,7 +790,7 @@ class SolarEdgeClient:
         """
         data = await self._request(
             "GET",
-            f"/site/{site_id}/meters",
+            self._p(site_id, "meters"),
             params={
                 "startTime": self._format_date(start_time),
                 "endTime": self._format_date(end_time),
@@ -416,25 +809,21 @@ class SolarEdgeClient:
         Returns:
             Environmental benefits dictionary with CO2 saved, trees planted, etc.
         """
-        data = await self._request("GET", f"/site/{site_id}/envBenefits")
+        data = await self._request("GET", self._p(site_id, "envBenefits"))
         return data.get("envBenefits", {})
 
     # Alert endpoints
 
-    async def get_alerts(self, site_id: int) -> list[dict[str, Any]]:
+    async def get_alerts(self, site_id: int) -> tuple[dict[str, Any], ...]:
         """Get alerts for a site.
 
         Args:
             site_id: Site ID.
 
         Returns:
-            List of alert dictionaries.
+            Tuple of alert dictionaries.
         """
-        data = await self._request("GET", f"/site/{site_id}/alerts")
-        alerts = data.get("alerts", {}).get("alert", [])
-        if isinstance(alerts, dict):
-            alerts = [alerts]
-        return alerts
+        return await self._get_list("alerts", site_id=site_id)
 
     # Inventory endpoints
 
@@ -447,9 +836,36 @@ class SolarEdgeClient:
         Returns:
             Inventory dictionary with inverters, optimizers, etc.
         """
-        data = await self._request("GET", f"/site/{site_id}/inventory")
+        data = await self._request("GET", self._p(site_id, "inventory"))
         return data.get("Inventory", {})
 
+    # Bundled endpoints
+
+    async def get_site_bundle(self, site_id: int) -> dict[str, Any]:
+        """Fetch all date-independent endpoints for a site concurrently.
+
+        Each request still passes through the rate limiter, so concurrency
+        and daily quota limits apply as usual.
+
+        Args:
+            site_id: Site ID.
+
+        Returns:
+            Dictionary keyed by endpoint name. A failed endpoint maps to the
+            exception it raised instead of its data.
+        """
+        requests = {
+            "details": self.get_site_details(site_id),
+            "equipment": self.get_equipment(site_id),
+            "inventory": self.get_inventory(site_id),
+            "environmental_benefits": self.get_environmental_benefits(site_id),
+            "meters": self.get_meters(site_id),
+            "power_flow": self.get_power_flow(site_id),
+            "alerts": self.get_alerts(site_id),
+        }
+        results = await asyncio.gather(*requests.values(), return_exceptions=True)
+        return dict(zip(requests, results, strict=True))
+
     # Utility methods
 
     @property
@@ -1,7 +1,7 @@
 """Pydantic models for SolarEdge API responses."""
 
 from seh.api.models.responses import (
-    BatteryData,
+    BatteryInfo,
     BatteryTelemetry,
     EnergyData,
     EnergyDetails,
@@ -18,7 +18,7 @@ from seh.api.models.responses import (
 )
 
 __all__ = [
-    "BatteryData",
+    "BatteryInfo",
     "BatteryTelemetry",
     "EnergyData",
     "EnergyDetails",
@@ -2,10 +2,20 @@
 
 from datetime import date, datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
-class Location(BaseModel):
+class ResponseModel(BaseModel):
+    """Base class for API response models.
+
+    Responses are read-only once validated, so models are frozen; models
+    without list fields are also hashable.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+
+class Location(ResponseModel):
     """Site location details."""
 
     country: str | None = None
@@ -17,7 +27,7 @@ class Location(BaseModel):
     timeZone: str | None = None
 
 
-class PrimaryModule(BaseModel):
+class PrimaryModule(ResponseModel):
     """Primary solar module details."""
 
     manufacturerName: str | None = None
@@ -25,14 +35,14 @@ class PrimaryModule(BaseModel):
     maximumPower: float | None = None
 
 
-class PublicSettings(BaseModel):
+class PublicSettings(ResponseModel):
     """Public settings for a site."""
 
     isPublic: bool | None = None
     name: str | None = None
 
 
-class Site(BaseModel):
+class Site(ResponseModel):
     """Site summary from sites list."""
 
     id: int
@@ -50,19 +60,19 @@ class Site(BaseModel):
     publicSettings: PublicSettings | None = None
 
 
-class SiteDetails(BaseModel):
+class SiteDetails(ResponseModel):
     """Detailed site information."""
 
     details: Site
 
 
-class SitesResponse(BaseModel):
+class SitesResponse(ResponseModel):
     """Response from /sites endpoint."""
 
     sites: dict
 
 
-class Inverter(BaseModel):
+class Inverter(ResponseModel):
     """Inverter details."""
 
     name: str | None = None
@@ -76,58 +86,58 @@ class Inverter(BaseModel):
     connectedOptimizers: int | None = None
 
 
-class EquipmentData(BaseModel):
+class EquipmentData(ResponseModel):
     """Equipment list response."""
 
     reporters: dict
 
 
-class EnergyValue(BaseModel):
+class EnergyValue(ResponseModel):
     """Single energy value."""
 
     date: str
     value: float | None = None
 
 
-class EnergyData(BaseModel):
+class EnergyData(ResponseModel):
     """Energy data response."""
 
     energy: dict
 
 
-class EnergyDetails(BaseModel):
+class EnergyDetails(ResponseModel):
     """Detailed energy data."""
 
     energyDetails: dict
 
 
-class PowerValue(BaseModel):
+class PowerValue(ResponseModel):
     """Single power value."""
 
     date: str
     value: float | None = None
 
 
-class PowerData(BaseModel):
+class PowerData(ResponseModel):
     """Power data response."""
 
     power: dict
 
 
-class PowerDetails(BaseModel):
+class PowerDetails(ResponseModel):
     """Detailed power data."""
 
     powerDetails: dict
 
 
-class Connection(BaseModel):
+class Connection(ResponseModel):
     """Power flow connection."""
 
     from_: str = Field(alias="from")
     to: str
 
 
-class SiteCurrentPowerFlow(BaseModel):
+class SiteCurrentPowerFlow(ResponseModel):
     """Current power flow at a site."""
 
     updateRefreshRate: int | None = None
@@ -139,13 +149,13 @@ class SiteCurrentPowerFlow(BaseModel):
     STORAGE: dict | None = None
 
 
-class PowerFlowData(BaseModel):
+class PowerFlowData(ResponseModel):
     """Power flow response."""
 
     siteCurrentPowerFlow: SiteCurrentPowerFlow
 
 
-class BatteryInfo(BaseModel):
+class BatteryInfo(ResponseModel):
     """Battery/storage unit info."""
 
     nameplate: float | None = None
@@ -154,7 +164,7 @@ class BatteryInfo(BaseModel):
     manufacturerName: str | None = None
 
 
-class BatteryTelemetryValue(BaseModel):
+class BatteryTelemetryValue(ResponseModel):
     """Single battery telemetry value."""
 
     timeStamp: datetime
@@ -167,7 +177,7 @@ class BatteryTelemetryValue(BaseModel):
     internalTemp: float | None = None
 
 
-class BatteryTelemetry(BaseModel):
+class BatteryTelemetry(ResponseModel):
     """Battery telemetry data."""
 
     serialNumber: str
@@ -178,13 +188,13 @@ class BatteryTelemetry(BaseModel):
     telemetries: list[BatteryTelemetryValue] = []
 
 
-class StorageData(BaseModel):
+class StorageData(ResponseModel):
     """Storage data response."""
 
     storageData: dict
 
 
-class MeterInfo(BaseModel):
+class MeterInfo(ResponseModel):
     """Meter device info."""
 
     name: str
@@ -196,7 +206,7 @@ class MeterInfo(BaseModel):
     form: str | None = None
 
 
-class MeterValue(BaseModel):
+class MeterValue(ResponseModel):
     """Single meter reading value."""
 
     date: str
@@ -204,13 +214,19 @@ class MeterValue(BaseModel):
     values: dict = {}
 
 
-class MeterData(BaseModel):
+class MeterData(ResponseModel):
     """Meter data from API."""
 
     meters: list[MeterInfo] = []
 
 
-class MeterReading(BaseModel):
+class MeterReading(ResponseModel):
     """Meter reading data."""
 
     meterEnergyDetails: dict
+
+
+# Validates a whole storageData.batteries array in a single pydantic-core call
+BATTERY_TELEMETRY_ADAPTER: TypeAdapter[list[BatteryTelemetry]] = TypeAdapter(
+    list[BatteryTelemetry]
+)
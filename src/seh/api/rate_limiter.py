@@ -1,6 +1,9 @@
 """Rate limiter for SolarEdge API requests."""
 
 import asyncio
+import time
+from array import array
+from bisect import bisect_right
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -10,6 +13,9 @@ from seh.utils.exceptions import RateLimitError
 
 logger = structlog.get_logger(__name__)
 
+# Length of the rolling quota window in seconds
+_WINDOW_SECONDS = 86400.0
+
 
 class RateLimiter:
     """Rate limiter with concurrent request limit and daily quota tracking."""
@@ -28,36 +34,63 @@ class RateLimiter:
         self._max_concurrent = max_concurrent
         self._daily_limit = daily_limit
         self._semaphore = asyncio.Semaphore(max_concurrent)
-        self._request_times: list[datetime] = []
+        # Ring buffer of monotonic clock readings, unaffected by NTP or DST
+        # adjustments. Quota is reserved before a request is made, so at most
+        # daily_limit readings are ever live at once.
+        self._capacity = max(1, daily_limit)
+        self._request_times = array("d", bytes(8 * self._capacity))
+        self._head = 0
+        self._count = 0
         self._lock = asyncio.Lock()
 
+    def _time_at(self, index: int) -> float:
+        """Get the request time at a position counted from the oldest entry."""
+        return self._request_times[(self._head + index) % self._capacity]
+
+    def _expire(self) -> None:
+        """Drop request times older than 24 hours.
+
+        Times are recorded in order, so the expired entries are found with a
+        binary search and dropped by advancing the head of the ring.
+        """
+        if not self._count:
+            return
+        cutoff = time.monotonic() - _WINDOW_SECONDS
+        expired = bisect_right(range(self._count), cutoff, key=self._time_at)
+        self._head = (self._head + expired) % self._capacity
+        self._count -= expired
+
     async def acquire(self) -> None:
         """Acquire permission to make a request.
 
+        The daily quota slot is reserved inside a single critical section,
+        so the lock is only taken once per request.
+
         Raises:
             RateLimitError: If daily limit would be exceeded.
         """
         async with self._lock:
-            # Clean up old request times (older than 24 hours)
-            cutoff = datetime.now() - timedelta(days=1)
-            self._request_times = [t for t in self._request_times if t > cutoff]
+            self._expire()
 
             # Check daily limit
-            if len(self._request_times) >= self._daily_limit:
-                oldest = min(self._request_times)
-                wait_until = oldest + timedelta(days=1)
+            if self._count >= self._daily_limit:
+                wait_seconds = self._time_at(0) + _WINDOW_SECONDS - time.monotonic()
+                wait_until = datetime.now() + timedelta(seconds=wait_seconds)
                 raise RateLimitError(
                     f"Daily API limit ({self._daily_limit}) reached. "
                     f"Resets at {wait_until.isoformat()}"
                 )
 
+            self._request_times[
+                (self._head + self._count) % self._capacity
+            ] = time.monotonic()
+            self._count += 1
+
         # Acquire semaphore for concurrent limit
         await self._semaphore.acquire()
 
     async def release(self) -> None:
         """Release the rate limiter after a request completes."""
-        async with self._lock:
-            self._request_times.append(datetime.now())
         self._semaphore.release()
 
     async def __aenter__(self) -> "RateLimiter":
@@ -72,8 +105,8 @@ class RateLimiter:
     @property
     def requests_today(self) -> int:
         """Get the number of requests made in the last 24 hours."""
-        cutoff = datetime.now() - timedelta(days=1)
-        return len([t for t in self._request_times if t > cutoff])
+        self._expire()
+        return self._count
 
     @property
     def remaining_requests(self) -> int:
@@ -1,23 +1,29 @@
 """Logging configuration using structlog with operation tracking and email notifications."""
 
+import atexit
 import logging
-import smtplib
+import queue
 import sys
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Any
 
+import orjson
 import structlog
 
 from seh.config.settings import Settings
 
+# Signature of the settings logging was last configured for
+_configured_for: int | None = None
 
-@dataclass
+# Thread writing queued records to the log file, when one is configured
+_file_listener: QueueListener | None = None
+
+
+@dataclass(slots=True)
 class SyncStats:
     """Statistics for a sync operation."""
 
@@ -32,11 +38,13 @@ class SyncStats:
     start_time: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     end_time: datetime | None = None
     duration_seconds: float = 0.0
+    # Monotonic clock for the duration; start_time/end_time are for display
+    _perf_start: float = field(default_factory=time.perf_counter, repr=False)
 
     def finish(self) -> None:
         """Mark the operation as complete and calculate duration."""
         self.end_time = datetime.now(timezone.utc)
-        self.duration_seconds = (self.end_time - self.start_time).total_seconds()
+        self.duration_seconds = time.perf_counter() - self._perf_start
 
     def add_error(self, error: str) -> None:
         """Add an error message."""
@@ -67,7 +75,7 @@ class SyncStats:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncSummary:
     """Summary of a complete sync operation across all sites and data types."""
 
@@ -77,26 +85,39 @@ class SyncSummary:
     sites_processed: int = 0
     total_records: int = 0
     stats: list[SyncStats] = field(default_factory=list)
+    _perf_start: float = field(default_factory=time.perf_counter, repr=False)
+    # (errors, warnings) counted by finish(), so the summary and email
+    # formatting do not rescan every operation for each total they show
+    _totals: tuple[int, int] | None = field(default=None, repr=False)
 
     def add_stats(self, stats: SyncStats) -> None:
         """Add stats from a sync operation."""
         self.stats.append(stats)
         self.total_records += stats.records_processed
+        self._totals = None
 
     def finish(self) -> None:
         """Mark the sync as complete."""
         self.end_time = datetime.now(timezone.utc)
-        self.duration_seconds = (self.end_time - self.start_time).total_seconds()
+        self.duration_seconds = time.perf_counter() - self._perf_start
+        self._totals = (
+            sum(len(s.errors) for s in self.stats),
+            sum(len(s.warnings) for s in self.stats),
+        )
 
     @property
     def total_errors(self) -> int:
         """Get total error count across all operations."""
-        return sum(len(s.errors) for s in self.stats)
+        if self._totals is None:
+            return sum(len(s.errors) for s in self.stats)
+        return self._totals[0]
 
     @property
     def total_warnings(self) -> int:
         """Get total warning count across all operations."""
-        return sum(len(s.warnings) for s in self.stats)
+        if self._totals is None:
+            return sum(len(s.warnings) for s in self.stats)
+        return self._totals[1]
 
     @property
     def success(self) -> bool:
@@ -126,11 +147,12 @@ class SyncSummary:
 
     def format_text_summary(self) -> str:
         """Format a human-readable text summary."""
+        success = self.success
         lines = [
             "=" * 60,
             "SYNC SUMMARY",
             "=" * 60,
-            f"Status: {'SUCCESS' if self.success else 'FAILED'}",
+            f"Status: {'SUCCESS' if success else 'FAILED'}",
             f"Duration: {self.duration_seconds:.1f} seconds",
             f"Sites processed: {self.sites_processed}",
             f"Total records: {self.total_records}",
@@ -143,13 +165,14 @@ class SyncSummary:
 
         for s in self.stats:
             site_str = f" (site {s.site_id})" if s.site_id else ""
-            status = "OK" if s.success else "FAILED"
+            error_count = len(s.errors)
+            status = "FAILED" if error_count else "OK"
             lines.append(
                 f"  {s.data_type}{site_str}: {s.records_processed} records, "
-                f"{len(s.errors)} errors [{status}]"
+                f"{error_count} errors [{status}]"
             )
 
-        if self.total_errors > 0:
+        if not success:
             lines.extend(["", "ERRORS:", "-" * 40])
             for data_type, site_id, error in self.all_errors:
                 site_str = f" (site {site_id})" if site_id else ""
@@ -195,6 +218,11 @@ class EmailNotifier:
             self._logger.error("SMTP to_emails not configured")
             return False
 
+        # Only commands that actually send mail pay for these imports
+        import smtplib
+        from email.mime.multipart import MIMEMultipart
+        from email.mime.text import MIMEText
+
         try:
             msg = MIMEMultipart("alternative")
             msg["Subject"] = subject
@@ -258,24 +286,26 @@ class EmailNotifier:
 
     def _format_html_summary(self, summary: SyncSummary) -> str:
         """Format an HTML summary for email."""
-        status_color = "green" if summary.success else "red"
-        status_text = "SUCCESS" if summary.success else "FAILED"
+        total_errors = summary.total_errors
+        status_color = "red" if total_errors else "green"
+        status_text = "FAILED" if total_errors else "SUCCESS"
 
         rows = []
         for s in summary.stats:
             site_str = f" (site {s.site_id})" if s.site_id else ""
-            row_color = "#f0f0f0" if s.success else "#ffcccc"
+            error_count = len(s.errors)
+            row_color = "#ffcccc" if error_count else "#f0f0f0"
             rows.append(
                 f'<tr style="background-color: {row_color}">'
                 f"<td>{s.data_type}{site_str}</td>"
                 f"<td>{s.records_processed}</td>"
-                f"<td>{len(s.errors)}</td>"
-                f'<td>{"OK" if s.success else "FAILED"}</td>'
+                f"<td>{error_count}</td>"
+                f'<td>{"FAILED" if error_count else "OK"}</td>'
                 f"</tr>"
             )
 
         error_html = ""
-        if summary.total_errors > 0:
+        if total_errors:
             error_rows = []
             for data_type, site_id, error in summary.all_errors:
                 site_str = f" (site {site_id})" if site_id else ""
@@ -290,7 +320,7 @@ class EmailNotifier:
                 <strong>Duration:</strong> {summary.duration_seconds:.1f} seconds<br>
                 <strong>Sites:</strong> {summary.sites_processed}<br>
                 <strong>Total records:</strong> {summary.total_records}<br>
-                <strong>Errors:</strong> {summary.total_errors}<br>
+                <strong>Errors:</strong> {total_errors}<br>
                 <strong>Warnings:</strong> {summary.total_warnings}
             </p>
             <h3>Operations</h3>
@@ -323,12 +353,13 @@ class OperationTimer:
         self.operation_name = operation_name
         self.logger = logger or structlog.get_logger()
         self.context = context
+        # perf_counter readings, only meaningful as a difference
         self.start_time: float = 0
         self.end_time: float = 0
 
     def __enter__(self) -> "OperationTimer":
         """Start timing."""
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         self.logger.info(
             f"Starting {self.operation_name}",
             operation=self.operation_name,
@@ -338,7 +369,7 @@ class OperationTimer:
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Stop timing and log duration."""
-        self.end_time = time.time()
+        self.end_time = time.perf_counter()
         duration = self.end_time - self.start_time
 
         if exc_type is not None:
@@ -362,15 +393,39 @@ class OperationTimer:
         """Get duration in seconds."""
         if self.end_time:
             return self.end_time - self.start_time
-        return time.time() - self.start_time
+        return time.perf_counter() - self.start_time
+
+
+def _orjson_dumps(value: Any, default: Any = None, **_kw: Any) -> str:
+    """Serialize a log event with orjson for structlog's JSONRenderer.
+
+    Non-string keys are allowed, as json.dumps allowed them, and values orjson
+    cannot serialize go through structlog's fallback handler.
+    """
+    return orjson.dumps(value, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
 
 
 def configure_logging(settings: Settings) -> None:
     """Configure structlog and standard logging.
 
+    Calling this again with equivalent logging settings is a no-op, so the
+    handlers and processor pipeline are only rebuilt when something changed.
+
     Args:
         settings: Application settings containing logging configuration.
     """
+    global _configured_for, _file_listener
+
+    signature = hash((
+        settings.log_level,
+        settings.log_file,
+        settings.log_max_bytes,
+        settings.log_backup_count,
+        sys.stdout.isatty(),
+    ))
+    if _configured_for == signature:
+        return
+
     # Map string log level to logging constant
     log_level = getattr(logging, settings.log_level)
 
@@ -382,7 +437,12 @@ def configure_logging(settings: Settings) -> None:
     console_handler.setLevel(log_level)
     handlers.append(console_handler)
 
-    # File handler (if configured)
+    # Flush and close the previous log file before replacing its handler
+    _stop_file_listener()
+
+    # File handler (if configured). Records are formatted by the queue
+    # handler in the logging thread, and a listener thread does the writes
+    # and rollovers so they never block the event loop.
     if settings.log_file:
         log_path = Path(settings.log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
@@ -393,13 +453,21 @@ def configure_logging(settings: Settings) -> None:
             backupCount=settings.log_backup_count,
         )
         file_handler.setLevel(log_level)
-        handlers.append(file_handler)
+
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setLevel(log_level)
+        handlers.append(queue_handler)
+
+        _file_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _file_listener.start()
 
     # Configure root logger
     logging.basicConfig(
         level=log_level,
         handlers=handlers,
         format="%(message)s",
+        force=True,
     )
 
     # Determine if we're in a TTY for colored output
@@ -435,7 +503,7 @@ def configure_logging(settings: Settings) -> None:
     else:
         # Production: JSON output for console
         console_formatter = structlog.stdlib.ProcessorFormatter(
-            processor=structlog.processors.JSONRenderer(),
+            processor=structlog.processors.JSONRenderer(serializer=_orjson_dumps),
             foreign_pre_chain=[
                 *shared_processors,
                 structlog.processors.dict_tracebacks,
@@ -444,7 +512,7 @@ def configure_logging(settings: Settings) -> None:
 
     # File formatter is always JSON (no ANSI color codes)
     file_formatter = structlog.stdlib.ProcessorFormatter(
-        processor=structlog.processors.JSONRenderer(),
+        processor=structlog.processors.JSONRenderer(serializer=_orjson_dumps),
         foreign_pre_chain=[
             *shared_processors,
             structlog.processors.dict_tracebacks,
@@ -454,7 +522,23 @@ def configure_logging(settings: Settings) -> None:
     # Apply appropriate formatter to each handler
     console_handler.setFormatter(console_formatter)
     if settings.log_file:
-        file_handler.setFormatter(file_formatter)
+        queue_handler.setFormatter(file_formatter)
+
+    _configured_for = signature
+
+
+def _stop_file_listener() -> None:
+    """Write any queued records to the log file and close it."""
+    global _file_listener
+
+    if _file_listener is not None:
+        _file_listener.stop()
+        for handler in _file_listener.handlers:
+            handler.close()
+        _file_listener = None
+
+
+atexit.register(_stop_file_listener)
 
 
 def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
@@ -1,9 +1,14 @@
 """Application settings using Pydantic Settings."""
 
+import contextlib
+import os
 import re
-from functools import lru_cache
+import shutil
+import tempfile
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Literal
+from urllib.parse import urlparse
 
 from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -29,6 +34,14 @@ class Settings(BaseSettings):
     api_timeout: int = Field(default=10, description="API request timeout in seconds")
     api_max_concurrent: int = Field(default=3, description="Maximum concurrent API requests")
     api_daily_limit: int = Field(default=300, description="Maximum API requests per day")
+    api_cache_dir: str | None = Field(
+        default=None,
+        description="Directory for caching static API responses (disabled if not set)",
+    )
+    api_cache_ttl: int = Field(
+        default=3600,
+        description="Seconds to serve cached static API responses before revalidating",
+    )
 
     # Database Configuration
     database_url: str = Field(
@@ -150,6 +163,14 @@ class Settings(BaseSettings):
         "environmental", "alert", "inventory", "inverter_telemetry", "optimizer_telemetry"
     })
 
+    @cached_property
+    def db_kind(self) -> str:
+        """Database backend name from the URL scheme, without the driver.
+
+        For example "postgresql" for "postgresql+psycopg://...".
+        """
+        return urlparse(self.database_url).scheme.split("+", 1)[0]
+
     def get_site_ids_list(self) -> list[int] | None:
         """Parse site_ids setting into a list of integers."""
         if not self.site_ids:
@@ -179,9 +200,18 @@ class Settings(BaseSettings):
         return valid_types if valid_types else None
 
 
-@lru_cache
-def get_settings() -> Settings:
-    """Get cached application settings."""
+@lru_cache(maxsize=4)
+def get_settings(env_file: str | None = None, mtime: float = 0.0) -> Settings:
+    """Get cached application settings.
+
+    Args:
+        env_file: Path to a .env file to read instead of ./.env.
+        mtime: Modification time of the .env file. Only part of the cache
+            key, so settings are reloaded once the file changes on disk.
+    """
+    if env_file:
+        # _env_file is a pydantic-settings init option, not a declared field
+        return Settings(_env_file=env_file)  # type: ignore[call-arg]
     return Settings()
 
 
@@ -194,7 +224,7 @@ def update_env_file(key: str, value: str, env_path: str = ".env") -> bool:
         env_path: Path to .env file.
 
     Returns:
-        True if file was updated, False if file doesn't exist.
+        True once the key is set in the file.
     """
     path = Path(env_path)
 
@@ -218,5 +248,20 @@ def update_env_file(key: str, value: str, env_path: str = ".env") -> bool:
             content += '\n'
         new_content = content + f'{key}={value}\n'
 
-    path.write_text(new_content)
+    if new_content == content:
+        # Already set; avoid rewriting the file
+        return True
+
+    # Write to a temporary file and swap it in so a crash never truncates .env
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(new_content)
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
     return True
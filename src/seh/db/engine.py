@@ -1,7 +1,10 @@
 """Database engine factory and session management."""
 
+import atexit
+import weakref
 from collections.abc import Generator
 from contextlib import contextmanager
+from functools import lru_cache
 
 from sqlalchemy import Engine
 from sqlalchemy import create_engine as sa_create_engine
@@ -10,32 +13,62 @@ from sqlalchemy.orm import Session, sessionmaker
 from seh.config.settings import Settings
 from seh.db.base import Base
 
+# Engines handed out by create_engine, disposed of at interpreter exit
+_ENGINES: "weakref.WeakSet[Engine]" = weakref.WeakSet()
+
 
 def create_engine(settings: Settings) -> Engine:
-    """Create a SQLAlchemy engine from settings.
+    """Get a SQLAlchemy engine for the configured database.
+
+    Engines are cached by database URL, so commands run in the same
+    process share one engine and its connection pool.
 
     Args:
         settings: Application settings containing database URL.
 
+    Returns:
+        Configured SQLAlchemy engine.
+    """
+    return _create_engine(settings.database_url, settings.log_level == "DEBUG")
+
+
+@lru_cache(maxsize=4)
+def _create_engine(database_url: str, echo: bool) -> Engine:
+    """Create a SQLAlchemy engine.
+
+    Args:
+        database_url: SQLAlchemy database URL.
+        echo: Whether to log SQL statements.
+
     Returns:
         Configured SQLAlchemy engine.
     """
     connect_args: dict = {}
 
     # SQLite-specific configuration
-    if settings.database_url.startswith("sqlite"):
+    if database_url.startswith("sqlite"):
         connect_args["check_same_thread"] = False
 
     engine = sa_create_engine(
-        settings.database_url,
+        database_url,
         connect_args=connect_args,
-        echo=settings.log_level == "DEBUG",
+        echo=echo,
         pool_pre_ping=True,
     )
+    _ENGINES.add(engine)
 
     return engine
 
 
+def _dispose_engines() -> None:
+    """Close the pooled connections of every engine still in use."""
+    for engine in list(_ENGINES):
+        engine.dispose()
+
+
+atexit.register(_dispose_engines)
+
+
 def create_tables(engine: Engine) -> None:
     """Create all database tables.
 
@@ -26,6 +26,7 @@ class EnergyReading(Base, TimestampMixin):
     # Relationship
     site: Mapped["Site"] = relationship("Site", back_populates="energy_readings")  # type: ignore[name-defined] # noqa: F821
 
+    # The unique constraint also provides the index exports scan in sort order
     __table_args__ = (
         UniqueConstraint("site_id", "reading_date", "time_unit", name="uq_energy_reading"),
     )
@@ -47,6 +47,7 @@ class InverterTelemetry(Base, TimestampMixin):
     # Relationship
     site: Mapped["Site"] = relationship("Site", back_populates="inverter_telemetry")  # type: ignore[name-defined] # noqa: F821
 
+    # The unique constraint also provides the index exports scan in sort order
     __table_args__ = (
         UniqueConstraint("site_id", "serial_number", "timestamp", name="uq_inverter_telemetry"),
     )
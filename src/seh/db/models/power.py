@@ -25,6 +25,7 @@ class PowerReading(Base, TimestampMixin):
     # Relationship
     site: Mapped["Site"] = relationship("Site", back_populates="power_readings")  # type: ignore[name-defined] # noqa: F821
 
+    # The unique constraint also provides the index exports scan in sort order
     __table_args__ = (
         UniqueConstraint("site_id", "timestamp", name="uq_power_reading"),
     )
@@ -1,8 +1,12 @@
 """Base repository class."""
 
-from typing import Generic, TypeVar
+from collections.abc import Sequence
+from typing import Any, Generic, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import Insert, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from seh.db.base import Base
@@ -77,3 +81,55 @@ class BaseRepository(Generic[ModelT]):
         """
         self.session.delete(instance)
         self.session.flush()
+
+    def _upsert_batch(
+        self,
+        rows: list[dict[str, Any]],
+        key_columns: Sequence[str],
+        update_columns: Sequence[str],
+        constraint: str,
+    ) -> int:
+        """Insert or update rows with a single statement for the whole batch.
+
+        The statement is built once and executed with every row as its
+        parameters, so it is compiled once rather than once per row. Columns
+        missing from a row are written as NULL.
+
+        Args:
+            rows: Dictionaries of column values.
+            key_columns: Columns of the unique constraint rows conflict on.
+            update_columns: Columns to overwrite when a row already exists.
+            constraint: Name of the unique constraint (used by PostgreSQL).
+
+        Returns:
+            Number of rows upserted.
+        """
+        if not rows:
+            return 0
+
+        dialect = self.session.bind.dialect.name if self.session.bind else "sqlite"
+        columns = (*key_columns, *update_columns)
+        params = [{column: row.get(column) for column in columns} for row in rows]
+
+        stmt: Insert
+        if dialect == "postgresql":
+            pg_stmt = pg_insert(self.model)
+            stmt = pg_stmt.on_conflict_do_update(
+                constraint=constraint,
+                set_={column: pg_stmt.excluded[column] for column in update_columns},
+            )
+        elif dialect in ("mysql", "mariadb"):
+            mysql_stmt = mysql_insert(self.model)
+            stmt = mysql_stmt.on_duplicate_key_update(
+                {column: mysql_stmt.inserted[column] for column in update_columns}
+            )
+        else:
+            sqlite_stmt = sqlite_insert(self.model)
+            stmt = sqlite_stmt.on_conflict_do_update(
+                index_elements=list(key_columns),
+                set_={column: sqlite_stmt.excluded[column] for column in update_columns},
+            )
+
+        self.session.execute(stmt, params)
+        self.session.flush()
+        return len(rows)
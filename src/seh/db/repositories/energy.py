@@ -3,9 +3,6 @@
 from datetime import date
 
 from sqlalchemy import select
-from sqlalchemy.dialects.mysql import insert as mysql_insert
-from sqlalchemy.dialects.postgresql import insert as pg_insert
-from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from seh.db.models.energy import EnergyReading
 from seh.db.repositories.base import BaseRepository
@@ -77,30 +74,9 @@ class EnergyRepository(BaseRepository[EnergyReading]):
         Returns:
             Number of records affected.
         """
-        if not readings:
-            return 0
-
-        dialect = self.session.bind.dialect.name if self.session.bind else "sqlite"
-
-        for reading in readings:
-            update_set = {"energy_wh": reading.get("energy_wh")}
-
-            if dialect == "postgresql":
-                stmt = pg_insert(EnergyReading).values(**reading)
-                stmt = stmt.on_conflict_do_update(
-                    constraint="uq_energy_reading",
-                    set_=update_set,
-                )
-            elif dialect in ("mysql", "mariadb"):
-                stmt = mysql_insert(EnergyReading).values(**reading)
-                stmt = stmt.on_duplicate_key_update(**update_set)
-            else:
-                stmt = sqlite_insert(EnergyReading).values(**reading)
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=["site_id", "reading_date", "time_unit"],
-                    set_=update_set,
-                )
-            self.session.execute(stmt)
-
-        self.session.flush()
-        return len(readings)
+        return self._upsert_batch(
+            readings,
+            key_columns=("site_id", "reading_date", "time_unit"),
+            update_columns=("energy_wh",),
+            constraint="uq_energy_reading",
+        )
@@ -133,30 +133,19 @@ class MeterReadingRepository(BaseRepository[MeterReading]):
         Returns:
             Number of records affected.
         """
-        if not readings:
-            return 0
-
-        dialect = self.session.bind.dialect.name if self.session.bind else "sqlite"
-
-        for reading in readings:
-            update_set = {k: v for k, v in reading.items() if k not in ("meter_id", "timestamp")}
-
-            if dialect == "postgresql":
-                stmt = pg_insert(MeterReading).values(**reading)
-                stmt = stmt.on_conflict_do_update(
-                    constraint="uq_meter_reading",
-                    set_=update_set,
-                )
-            elif dialect in ("mysql", "mariadb"):
-                stmt = mysql_insert(MeterReading).values(**reading)
-                stmt = stmt.on_duplicate_key_update(**update_set)
-            else:
-                stmt = sqlite_insert(MeterReading).values(**reading)
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=["meter_id", "timestamp"],
-                    set_=update_set,
-                )
-            self.session.execute(stmt)
-
-        self.session.flush()
-        return len(readings)
+        return self._upsert_batch(
+            readings,
+            key_columns=("meter_id", "timestamp"),
+            update_columns=(
+                "power",
+                "energy_lifetime",
+                "voltage_l1",
+                "voltage_l2",
+                "voltage_l3",
+                "current_l1",
+                "current_l2",
+                "current_l3",
+                "power_factor",
+            ),
+            constraint="uq_meter_reading",
+        )
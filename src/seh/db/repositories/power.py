@@ -68,33 +68,12 @@ class PowerRepository(BaseRepository[PowerReading]):
         Returns:
             Number of records affected.
         """
-        if not readings:
-            return 0
-
-        dialect = self.session.bind.dialect.name if self.session.bind else "sqlite"
-
-        for reading in readings:
-            update_set = {"power_watts": reading.get("power_watts")}
-
-            if dialect == "postgresql":
-                stmt = pg_insert(PowerReading).values(**reading)
-                stmt = stmt.on_conflict_do_update(
-                    constraint="uq_power_reading",
-                    set_=update_set,
-                )
-            elif dialect in ("mysql", "mariadb"):
-                stmt = mysql_insert(PowerReading).values(**reading)
-                stmt = stmt.on_duplicate_key_update(**update_set)
-            else:
-                stmt = sqlite_insert(PowerReading).values(**reading)
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=["site_id", "timestamp"],
-                    set_=update_set,
-                )
-            self.session.execute(stmt)
-
-        self.session.flush()
-        return len(readings)
+        return self._upsert_batch(
+            readings,
+            key_columns=("site_id", "timestamp"),
+            update_columns=("power_watts",),
+            constraint="uq_power_reading",
+        )
 
 
 class PowerFlowRepository(BaseRepository[PowerFlow]):
@@ -204,31 +183,15 @@ class PowerDetailsRepository(BaseRepository[PowerDetails]):
         Returns:
             Number of records affected.
         """
-        if not readings:
-            return 0
-
-        update_cols = ["production_w", "consumption_w", "self_consumption_w", "feed_in_w", "purchased_w"]
-        dialect = self.session.bind.dialect.name if self.session.bind else "sqlite"
-
-        for reading in readings:
-            update_set = {col: reading.get(col) for col in update_cols}
-
-            if dialect == "postgresql":
-                stmt = pg_insert(PowerDetails).values(**reading)
-                stmt = stmt.on_conflict_do_update(
-                    constraint="uq_power_details",
-                    set_=update_set,
-                )
-            elif dialect in ("mysql", "mariadb"):
-                stmt = mysql_insert(PowerDetails).values(**reading)
-                stmt = stmt.on_duplicate_key_update(**update_set)
-            else:
-                stmt = sqlite_insert(PowerDetails).values(**reading)
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=["site_id", "timestamp"],
-                    set_=update_set,
-                )
-            self.session.execute(stmt)
-
-        self.session.flush()
-        return len(readings)
+        return self._upsert_batch(
+            readings,
+            key_columns=("site_id", "timestamp"),
+            update_columns=(
+                "production_w",
+                "consumption_w",
+                "self_consumption_w",
+                "feed_in_w",
+                "purchased_w",
+            ),
+            constraint="uq_power_details",
+        )
@@ -4,6 +4,7 @@ from sqlalchemy import select
 from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import selectinload
 
 from seh.db.models.site import Site
 from seh.db.repositories.base import BaseRepository
@@ -23,6 +24,18 @@ class SiteRepository(BaseRepository[Site]):
         stmt = select(Site.id)
         return list(self.session.scalars(stmt).all())
 
+    def get_all_with_sync_metadata(self) -> list[Site]:
+        """Get all sites with their sync metadata loaded.
+
+        The metadata for every site is fetched in one extra query rather
+        than one lazy load per site.
+
+        Returns:
+            List of all sites.
+        """
+        stmt = select(Site).options(selectinload(Site.sync_metadata))
+        return list(self.session.scalars(stmt).all())
+
     def upsert(self, site_data: dict) -> Site:
         """Insert or update a site.
 
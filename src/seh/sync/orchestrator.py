@@ -1,7 +1,9 @@
 """Sync orchestrator to coordinate data synchronization."""
 
+import time
+from collections.abc import AsyncIterator, Iterable
 from dataclasses import dataclass
-from datetime import datetime
+from typing import Any
 
 import structlog
 from sqlalchemy import Engine
@@ -79,36 +81,65 @@ class SyncOrchestrator:
         Returns:
             Summary of sync operations.
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         logger.info("Starting sync for all sites", full=full)
 
-        # Get list of sites from API
-        sites = await self.client.get_sites()
+        results = [result async for result in self.sync_sites_iter(full=full)]
 
-        if not sites:
-            logger.warning("No sites found for this API key")
-            return SyncSummary(
-                total_sites=0,
-                successful_sites=0,
-                failed_sites=0,
-                total_records=0,
-                results=[],
-                duration_seconds=0,
-            )
+        # Calculate summary
+        successful = sum(1 for r in results if r.success)
+        total_records = sum(sum(r.records_synced.values()) for r in results)
+        duration = time.perf_counter() - start_time
 
-        results: list[SyncResult] = []
+        summary = SyncSummary(
+            total_sites=len(results),
+            successful_sites=successful,
+            failed_sites=len(results) - successful,
+            total_records=total_records,
+            results=results,
+            duration_seconds=duration,
+        )
 
-        for site in sites:
-            site_id = site.get("id")
-            site_name = site.get("name")
+        logger.info(
+            "Sync complete",
+            sites=summary.total_sites,
+            successful=summary.successful_sites,
+            records=summary.total_records,
+            duration=f"{summary.duration_seconds:.1f}s",
+        )
+
+        return summary
+
+    async def sync_sites_iter(
+        self,
+        site_ids: Iterable[int] | None = None,
+        full: bool = False,
+    ) -> AsyncIterator[SyncResult]:
+        """Sync sites one at a time, yielding each result as it completes.
 
+        Args:
+            site_ids: Site IDs to sync, or None to sync every site on the account.
+            full: If True, perform full sync for all data types.
+
+        Yields:
+            Result of each site's sync operation.
+        """
+        if site_ids is None:
+            # Get list of sites from API
+            sites = [(site.get("id"), site.get("name")) for site in await self.client.get_sites()]
+            if not sites:
+                logger.warning("No sites found for this API key")
+        else:
+            sites = [(site_id, None) for site_id in site_ids]
+
+        for site_id, site_name in sites:
             if not site_id:
                 continue
 
             try:
                 result = await self.sync_site(site_id, full=full)
-                result.site_name = site_name
-                results.append(result)
+                if site_name is not None:
+                    result.site_name = site_name
             except Exception as e:
                 # In strict mode, sync_site raises on first error
                 if self.settings.error_handling == "strict":
@@ -124,40 +155,15 @@ class SyncOrchestrator:
                     site_id=site_id,
                     error=str(e),
                 )
-                results.append(
-                    SyncResult(
-                        site_id=site_id,
-                        site_name=site_name,
-                        success=False,
-                        records_synced={},
-                        errors={"sync": str(e)},
-                        duration_seconds=0,
-                    )
+                result = SyncResult(
+                    site_id=site_id,
+                    site_name=site_name,
+                    success=False,
+                    records_synced={},
+                    errors={"sync": str(e)},
+                    duration_seconds=0,
                 )
-
-        # Calculate summary
-        successful = sum(1 for r in results if r.success)
-        total_records = sum(sum(r.records_synced.values()) for r in results)
-        duration = (datetime.now() - start_time).total_seconds()
-
-        summary = SyncSummary(
-            total_sites=len(results),
-            successful_sites=successful,
-            failed_sites=len(results) - successful,
-            total_records=total_records,
-            results=results,
-            duration_seconds=duration,
-        )
-
-        logger.info(
-            "Sync complete",
-            sites=summary.total_sites,
-            successful=summary.successful_sites,
-            records=summary.total_records,
-            duration=f"{summary.duration_seconds:.1f}s",
-        )
-
-        return summary
+            yield result
 
     async def sync_site(self, site_id: int, full: bool = False) -> SyncResult:
         """Sync a single site.
@@ -169,7 +175,7 @@ class SyncOrchestrator:
         Returns:
             Result of sync operation.
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         logger.info("Syncing site", site_id=site_id, full=full)
 
         records_synced: dict[str, int] = {}
@@ -232,7 +238,7 @@ class SyncOrchestrator:
                         errors[strategy.data_type] = str(e)
                         records_synced[strategy.data_type] = 0
 
-        duration = (datetime.now() - start_time).total_seconds()
+        duration = time.perf_counter() - start_time
 
         return SyncResult(
             site_id=site_id,
@@ -243,42 +249,55 @@ class SyncOrchestrator:
             duration_seconds=duration,
         )
 
-    async def get_sites(self) -> list[dict]:
+    async def get_sites(self) -> tuple[dict, ...]:
         """Get list of sites from API.
 
         Returns:
-            List of site dictionaries.
+            Tuple of site dictionaries.
         """
         return await self.client.get_sites()
 
-    def get_sync_status(self) -> list[dict]:
+    def get_sync_status(self) -> list[dict[str, Any]]:
         """Get sync status for all sites.
 
         Returns:
             List of sync status dictionaries.
         """
-        with get_session(self.engine) as session:
-            site_repo = SiteRepository(session)
-            sites = site_repo.get_all()
-
-            statuses = []
-            for site in sites:
-                status = {
-                    "site_id": site.id,
-                    "site_name": site.name,
-                    "last_update": site.updated_at,
-                    "data_types": {},
-                }
+        return get_sync_status(self.engine)
 
-                for metadata in site.sync_metadata:
-                    status["data_types"][metadata.data_type] = {
-                        "last_sync": metadata.last_sync_time,
-                        "last_data": metadata.last_data_timestamp,
-                        "records": metadata.records_synced,
-                        "status": metadata.status,
-                        "error": metadata.error_message,
-                    }
 
-                statuses.append(status)
+def get_sync_status(engine: Engine) -> list[dict[str, Any]]:
+    """Get sync status for all sites from the database.
+
+    Only the database is read, so no API client is needed.
+
+    Args:
+        engine: SQLAlchemy engine.
+
+    Returns:
+        List of sync status dictionaries.
+    """
+    with get_session(engine) as session:
+        site_repo = SiteRepository(session)
+        sites = site_repo.get_all_with_sync_metadata()
+
+        statuses = []
+        for site in sites:
+            data_types: dict[str, dict[str, Any]] = {}
+            for metadata in site.sync_metadata:
+                data_types[metadata.data_type] = {
+                    "last_sync": metadata.last_sync_time,
+                    "last_data": metadata.last_data_timestamp,
+                    "records": metadata.records_synced,
+                    "status": metadata.status,
+                    "error": metadata.error_message,
+                }
+
+            statuses.append({
+                "site_id": site.id,
+                "site_name": site.name,
+                "last_update": site.updated_at,
+                "data_types": data_types,
+            })
 
-            return statuses
+        return statuses
@@ -49,9 +49,9 @@ class AlertSyncStrategy(BaseSyncStrategy):
                 # Parse timestamp
                 alert_timestamp = None
                 if alert.get("alertTimestamp"):
-                    with contextlib.suppress(ValueError, AttributeError):
+                    with contextlib.suppress(ValueError, TypeError):
                         alert_timestamp = datetime.fromisoformat(
-                            alert["alertTimestamp"].replace("Z", "+00:00")
+                            alert["alertTimestamp"]
                         )
 
                 db_data = {
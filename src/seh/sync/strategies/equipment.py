@@ -61,9 +61,9 @@ class EquipmentSyncStrategy(BaseSyncStrategy):
 
                 # Parse last report date
                 if equip.get("lastReportDate"):
-                    with contextlib.suppress(ValueError, AttributeError):
+                    with contextlib.suppress(ValueError, TypeError):
                         db_data["last_report_date"] = datetime.fromisoformat(
-                            equip["lastReportDate"].replace("Z", "+00:00")
+                            equip["lastReportDate"]
                         )
 
                 repo.upsert(db_data)
@@ -121,7 +121,7 @@ class MeterSyncStrategy(BaseSyncStrategy):
                         timestamp = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
                     except ValueError:
                         try:
-                            timestamp = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+                            timestamp = datetime.fromisoformat(date_str)
                         except ValueError:
                             continue
 
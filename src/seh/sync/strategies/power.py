@@ -104,7 +104,7 @@ class PowerSyncStrategy(BaseSyncStrategy):
                 timestamp = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
             except ValueError:
                 try:
-                    timestamp = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+                    timestamp = datetime.fromisoformat(date_str)
                 except ValueError:
                     logger.warning("Invalid timestamp format", timestamp=date_str)
                     continue
@@ -121,7 +121,7 @@ class PowerDetailsSyncStrategy(BaseSyncStrategy):
                     ts = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
                 except ValueError:
                     try:
-                        ts = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+                        ts = datetime.fromisoformat(date_str)
                     except ValueError:
                         logger.warning("Unparseable timestamp", raw=date_str)
                         continue
@@ -66,9 +66,9 @@ class SiteSyncStrategy(BaseSyncStrategy):
 
             # Parse dates
             if site_data.get("lastUpdateTime"):
-                with contextlib.suppress(ValueError, AttributeError):
+                with contextlib.suppress(ValueError, TypeError):
                     db_data["last_update_time"] = datetime.fromisoformat(
-                        site_data["lastUpdateTime"].replace("Z", "+00:00")
+                        site_data["lastUpdateTime"]
                     )
 
             if site_data.get("installationDate"):
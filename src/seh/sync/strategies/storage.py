@@ -89,7 +89,7 @@ class StorageSyncStrategy(BaseSyncStrategy):
                     ts_str = latest_telemetry.get("timeStamp")
                     if ts_str:
                         try:
-                            ts = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
+                            ts = datetime.fromisoformat(ts_str)
                             db_data["last_telemetry_time"] = ts
                             if latest_timestamp is None or ts > latest_timestamp:
                                 latest_timestamp = ts
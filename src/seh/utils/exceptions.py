@@ -16,15 +16,22 @@ class ConfigurationError(SEHError):
 class APIError(SEHError):
     """Error communicating with the SolarEdge API."""
 
-    def __init__(self, message: str, status_code: int | None = None) -> None:
+    def __init__(
+        self,
+        message: str,
+        status_code: int | None = None,
+        retry_after: float | None = None,
+    ) -> None:
         """Initialize API error.
 
         Args:
             message: Error message.
             status_code: HTTP status code if available.
+            retry_after: Seconds the server asked us to wait before retrying.
         """
         super().__init__(message)
         self.status_code = status_code
+        self.retry_after = retry_after
 
 
 class RateLimitError(APIError):
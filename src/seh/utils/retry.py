@@ -1,6 +1,7 @@
 """Retry decorator with exponential backoff."""
 
 import asyncio
+import random
 from collections.abc import Callable, Coroutine
 from functools import wraps
 from typing import Any, ParamSpec, TypeVar
@@ -23,6 +24,10 @@ def retry_with_backoff(
 ) -> Callable[[Callable[P, Coroutine[Any, Any, T]]], Callable[P, Coroutine[Any, Any, T]]]:
     """Decorator that retries an async function with exponential backoff.
 
+    Server errors and connection failures are retried with jittered
+    exponential backoff. HTTP 429 responses wait for the server's Retry-After
+    delay when one is given. Other client errors are raised immediately.
+
     Args:
         max_retries: Maximum number of retry attempts.
         base_delay: Base delay in seconds (doubles each retry).
@@ -46,13 +51,15 @@ def retry_with_backoff(
                 except RateLimitError:
                     # Don't retry rate limit errors
                     raise
-                except APIError as e:
-                    # Don't retry client errors (4xx) - they won't succeed on retry
-                    if e.status_code and 400 <= e.status_code < 500:
-                        raise
-                    last_exception = e
                 except exceptions as e:
                     last_exception = e
+                    status_code = getattr(e, "status_code", None)
+                    retry_after = getattr(e, "retry_after", None)
+
+                    # Don't retry client errors (4xx) - they won't succeed on
+                    # retry - except 429, where the server says when to come back
+                    if status_code and 400 <= status_code < 500 and status_code != 429:
+                        raise
 
                     if attempt == max_retries:
                         logger.error(
@@ -63,7 +70,14 @@ def retry_with_backoff(
                         )
                         raise
 
-                    delay = min(base_delay * (2**attempt), max_delay)
+                    if status_code == 429 and retry_after is not None:
+                        delay = min(retry_after, max_delay)
+                    else:
+                        # Jitter spreads out retries from concurrent requests
+                        delay = min(
+                            base_delay * (2**attempt) * random.uniform(0.8, 1.2),
+                            max_delay,
+                        )
                     logger.warning(
                         "Retrying after error",
                         function=func.__name__,
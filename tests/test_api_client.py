@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, patch, MagicMock
 
 import pytest
 import httpx
+from pydantic import ValidationError
 
 from seh.api.client import SolarEdgeClient
 from seh.api.rate_limiter import RateLimiter
@@ -35,6 +36,29 @@ class TestSolarEdgeClient:
         dt = datetime(2024, 1, 15, 12, 30, 45)
         assert client._format_date(dt) == "2024-01-15 12:30:45"
 
+    def test_format_date_with_aware_datetime(self, client):
+        """Test _format_date drops offset and microseconds like strftime did."""
+        from datetime import timezone
+
+        dt = datetime(2024, 1, 15, 12, 30, 45, 123456, tzinfo=timezone.utc)
+        assert client._format_date(dt) == "2024-01-15 12:30:45"
+
+    def test_format_date_same_instant_other_zone(self, client):
+        """Test equal aware datetimes in different zones keep their own wall-clock time."""
+        from datetime import timedelta, timezone
+
+        utc = datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+        plus_two = utc.astimezone(timezone(timedelta(hours=2)))
+        assert utc == plus_two
+        assert client._format_date(utc) == "2024-01-15 12:00:00"
+        assert client._format_date(plus_two) == "2024-01-15 14:00:00"
+
+    def test_site_paths_reused(self, client):
+        """Test per-site paths are built once and reused."""
+        path = client._p(12345, "details")
+        assert path == "/site/12345/details"
+        assert client._p(12345, "details") is path
+
     def test_format_date_with_none(self, client):
         """Test _format_date with None."""
         assert client._format_date(None) is None
@@ -46,6 +70,49 @@ class TestSolarEdgeClient:
             assert c._client is not None
         assert c._client is None
 
+    @pytest.mark.asyncio
+    async def test_context_manager_uses_base_url(self, client, test_settings):
+        """Test the underlying HTTP client is bound to the API origin."""
+        async with client as c:
+            assert str(c._client.base_url).rstrip("/") == test_settings.api_base_url
+            assert c._client.params["api_key"] == test_settings.api_key.get_secret_value()
+
+    @pytest.mark.asyncio
+    async def test_accept_encoding_matches_decoders(self, client, monkeypatch):
+        """Test brotli is only requested when it can be decoded."""
+        import builtins
+
+        from seh.api._pool import _accept_encoding
+
+        real_import = builtins.__import__
+
+        def no_brotli(name, *args, **kwargs):
+            if name in ("brotli", "brotlicffi"):
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", no_brotli)
+        assert _accept_encoding() == "gzip"
+        monkeypatch.undo()
+
+        async with client as c:
+            assert "gzip" in c._client.headers["Accept-Encoding"]
+
+    @pytest.mark.asyncio
+    async def test_clients_share_connection_pool(self, test_settings):
+        """Test separate client sessions reuse one HTTP connection pool."""
+        async with SolarEdgeClient(test_settings) as first:
+            pool = first._client
+        async with SolarEdgeClient(test_settings) as second:
+            assert second._client is pool
+        assert not pool.is_closed
+
+    @pytest.mark.asyncio
+    async def test_request_rejects_non_get(self, client):
+        """Test only GET requests are supported."""
+        with pytest.raises(ValueError, match="Unsupported HTTP method"):
+            await client._request("POST", "/test")
+
     @pytest.mark.asyncio
     async def test_request_without_context_manager_raises(self, client):
         """Test that request without context manager raises error."""
@@ -97,8 +164,7 @@ class TestSolarEdgeClientMocked:
             async with client:
                 sites = await client.get_sites()
 
-            assert len(sites) == 1
-            assert sites[0]["name"] == "Single Site"
+            assert sites == ({"id": 12345, "name": "Single Site"},)
 
     @pytest.mark.asyncio
     async def test_get_site_details(self, test_settings):
@@ -189,6 +255,262 @@ class TestSolarEdgeClientMocked:
             assert benefits["treesPlanted"] == 10.5
             assert benefits["gasEmissionSaved"]["co2"] == 500.0
 
+    @pytest.mark.asyncio
+    async def test_request_decodes_json_body(self, test_settings):
+        """Test _request parses the raw response body."""
+        client = SolarEdgeClient(test_settings)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/site/12345/details"
+            return httpx.Response(200, content=b'{"details": {"name": "Test Site"}}')
+
+        client._client = httpx.AsyncClient(
+            base_url=test_settings.api_base_url,
+            transport=httpx.MockTransport(handler),
+        )
+        try:
+            data = await client._request("GET", "/site/12345/details")
+        finally:
+            await client._client.aclose()
+
+        assert data == {"details": {"name": "Test Site"}}
+
+    @pytest.mark.asyncio
+    async def test_large_body_parsed_in_thread(self, test_settings, monkeypatch):
+        """Test large bodies are parsed off the event loop."""
+        import seh.api.client as client_module
+
+        monkeypatch.setattr(client_module, "_OFFLOAD_PARSE_BYTES", 16)
+        client = SolarEdgeClient(test_settings)
+        offloaded = []
+        real_to_thread = client_module.asyncio.to_thread
+
+        async def spy_to_thread(func, *args):
+            offloaded.append(func)
+            return await real_to_thread(func, *args)
+
+        monkeypatch.setattr(client_module.asyncio, "to_thread", spy_to_thread)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b'{"details": {"name": "Test Site"}}')
+
+        client._client = httpx.AsyncClient(
+            base_url=test_settings.api_base_url,
+            transport=httpx.MockTransport(handler),
+        )
+        try:
+            data = await client._request("GET", "/site/12345/details")
+        finally:
+            await client._client.aclose()
+
+        assert data == {"details": {"name": "Test Site"}}
+        assert offloaded == [client_module.orjson.loads]
+
+    @pytest.mark.asyncio
+    async def test_error_body_truncated(self, test_settings):
+        """Test large error bodies are cut down before being reported."""
+        client = SolarEdgeClient(test_settings)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(403, content=b"x" * 100_000)
+
+        client._client = httpx.AsyncClient(
+            base_url=test_settings.api_base_url,
+            transport=httpx.MockTransport(handler),
+        )
+        try:
+            with pytest.raises(APIError) as exc_info:
+                await client._request("GET", "/site/12345/details")
+        finally:
+            await client._client.aclose()
+
+        assert exc_info.value.status_code == 403
+        assert str(exc_info.value).count("x") == 200
+
+    @pytest.mark.asyncio
+    async def test_static_responses_cached_on_disk(self, test_settings, tmp_path):
+        """Test static endpoints are served from the disk cache without quota use."""
+        settings = test_settings.model_copy(update={"api_cache_dir": str(tmp_path)})
+        client = SolarEdgeClient(settings)
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            return httpx.Response(200, content=b'{"details": {"name": "Test Site"}}')
+
+        http_client = httpx.AsyncClient(
+            base_url=settings.api_base_url,
+            transport=httpx.MockTransport(handler),
+        )
+        # A second client instance has an empty in-memory memo, so its
+        # response must come from disk.
+        other = SolarEdgeClient(settings)
+        client._client = other._client = http_client
+        try:
+            first = await client._request("GET", "/site/12345/details")
+            second = await other._request("GET", "/site/12345/details")
+        finally:
+            await http_client.aclose()
+
+        assert first == second == {"details": {"name": "Test Site"}}
+        assert calls == ["/site/12345/details"]
+        assert other.requests_today == 0
+
+    @pytest.mark.asyncio
+    async def test_repeated_requests_memoized(self, test_settings):
+        """Test identical static requests within a run are answered from memory."""
+        client = SolarEdgeClient(test_settings)
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.params["size"])
+            return httpx.Response(200, content=b'{"sites": {"site": []}}')
+
+        client._client = httpx.AsyncClient(
+            base_url=test_settings.api_base_url,
+            transport=httpx.MockTransport(handler),
+        )
+        params = {"size": 100}
+        try:
+            first = await client._request("GET", "/sites/list", params=dict(params))
+            first["sites"]["site"].append("mutated")
+            second = await client._request("GET", "/sites/list", params=dict(params))
+        finally:
+            await client._client.aclose()
+
+        assert len(calls) == 1
+        assert second == {"sites": {"site": []}}
+        assert client.requests_today == 1
+
+    @pytest.mark.asyncio
+    async def test_time_series_requests_not_memoized(self, test_settings):
+        """Test date-window requests are not kept in memory."""
+        client = SolarEdgeClient(test_settings)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b'{"power": {"values": []}}')
+
+        client._client = httpx.AsyncClient(
+            base_url=test_settings.api_base_url,
+            transport=httpx.MockTransport(handler),
+        )
+        try:
+            await client._request("GET", "/site/12345/power", params={"startTime": "2024-01-15"})
+        finally:
+            await client._client.aclose()
+
+        assert client._memo == {}
+
+    def test_expired_memo_entries_dropped(self, test_settings):
+        """Test memoizing a response removes entries past their TTL."""
+        import time
+
+        import seh.api.client as client_module
+
+        client = SolarEdgeClient(test_settings)
+        client._memo[("/sites/list", ())] = (time.monotonic() - client_module._MEMO_TTL, {})
+
+        client._remember(("/site/1/details", ()), {"details": {}})
+
+        assert list(client._memo) == [("/site/1/details", ())]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_ijson", [True, False])
+    async def test_get_energy_details_iter(self, test_settings, monkeypatch, use_ijson):
+        """Test energy details stream one meter at a time."""
+        import seh.api.client as client_module
+
+        if use_ijson:
+            pytest.importorskip("ijson")
+        else:
+            monkeypatch.setattr(client_module, "ijson", None)
+        client = SolarEdgeClient(test_settings)
+        body = (
+            b'{"energyDetails": {"timeUnit": "QUARTER_OF_AN_HOUR", "meters": ['
+            b'{"type": "Production", "values": [{"date": "2024-01-15 00:00:00", "value": 1.5}]},'
+            b'{"type": "Consumption", "values": []}]}}'
+        )
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/site/12345/energyDetails"
+            assert request.url.params["timeUnit"] == "QUARTER_OF_AN_HOUR"
+            return httpx.Response(200, content=body)
+
+        client._client = httpx.AsyncClient(
+            base_url=test_settings.api_base_url,
+            transport=httpx.MockTransport(handler),
+        )
+        try:
+            meters = [
+                meter
+                async for meter in client.get_energy_details_iter(
+                    12345, datetime(2024, 1, 1), datetime(2024, 3, 1)
+                )
+            ]
+        finally:
+            await client._client.aclose()
+
+        assert [m["type"] for m in meters] == ["Production", "Consumption"]
+        assert meters[0]["values"][0]["value"] == 1.5
+        assert client.requests_today == 1
+
+    @pytest.mark.asyncio
+    async def test_get_site_bundle(self, test_settings):
+        """Test get_site_bundle labels results and keeps failures per endpoint."""
+        client = SolarEdgeClient(test_settings)
+
+        async def fake_request(method, path, params=None):
+            if path.endswith("/alerts"):
+                raise APIError("Forbidden", status_code=403)
+            return {"details": {"name": "Test Site"}}
+
+        with patch.object(client, "_request", side_effect=fake_request):
+            async with client:
+                bundle = await client.get_site_bundle(12345)
+
+        assert bundle["details"] == {"name": "Test Site"}
+        assert isinstance(bundle["alerts"], APIError)
+        assert set(bundle) == {
+            "details", "equipment", "inventory", "environmental_benefits",
+            "meters", "power_flow", "alerts",
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_storage_data_typed(self, test_settings):
+        """Test get_storage_data_typed validates batteries into models."""
+        client = SolarEdgeClient(test_settings)
+
+        with patch.object(client, '_request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = {
+                "storageData": {
+                    "batteryCount": 1,
+                    "batteries": [{
+                        "serialNumber": "BAT001",
+                        "nameplate": 10000,
+                        "unknownField": "ignored",
+                        "telemetries": [
+                            {"timeStamp": "2024-01-15 12:00:00", "power": 1500.0},
+                        ],
+                    }],
+                }
+            }
+
+            async with client:
+                batteries = await client.get_storage_data_typed(
+                    12345,
+                    datetime(2024, 1, 15, 0, 0),
+                    datetime(2024, 1, 15, 23, 59),
+                )
+
+            assert batteries[0].serialNumber == "BAT001"
+            assert batteries[0].telemetries[0].timeStamp == datetime(2024, 1, 15, 12, 0)
+            assert batteries[0].telemetries[0].power == 1500.0
+            # Validated models are read-only and hashable for dedup
+            sample = batteries[0].telemetries[0]
+            with pytest.raises(ValidationError):
+                sample.power = 0.0
+            assert len({sample, sample.model_copy()}) == 1
+
 
 class TestRateLimiter:
     """Test RateLimiter."""
@@ -227,3 +549,141 @@ class TestRateLimiter:
         with pytest.raises(RateLimitError, match="Daily API limit"):
             async with limiter:
                 pass
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_reserves_quota_on_acquire(self):
+        """Test in-flight requests count against the daily limit."""
+        from seh.utils.exceptions import RateLimitError
+
+        limiter = RateLimiter(max_concurrent=3, daily_limit=2)
+
+        await limiter.acquire()
+        await limiter.acquire()
+        assert limiter.requests_today == 2
+
+        with pytest.raises(RateLimitError):
+            await limiter.acquire()
+
+        await limiter.release()
+        await limiter.release()
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_window_expires(self, monkeypatch):
+        """Test requests older than 24 hours no longer count."""
+        import seh.api.rate_limiter as rate_limiter_module
+
+        now = 1000.0
+        monkeypatch.setattr(rate_limiter_module.time, "monotonic", lambda: now)
+        limiter = RateLimiter(max_concurrent=3, daily_limit=1)
+
+        async with limiter:
+            pass
+        assert limiter.remaining_requests == 0
+
+        now += 86400.0 + 1
+        assert limiter.requests_today == 0
+        async with limiter:
+            pass
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_ring_wraps(self, monkeypatch):
+        """Test expired slots are reused once the ring buffer wraps around."""
+        import seh.api.rate_limiter as rate_limiter_module
+
+        now = 1000.0
+        monkeypatch.setattr(rate_limiter_module.time, "monotonic", lambda: now)
+        limiter = RateLimiter(max_concurrent=1, daily_limit=3)
+
+        for offset in range(5):
+            now = 1000.0 + offset * 30000.0
+            async with limiter:
+                pass
+
+        # Requests older than 24 hours have dropped out of the window
+        assert limiter.requests_today == 3
+
+
+class TestRetryWithBackoff:
+    """Test retry_with_backoff."""
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch):
+        """Record retry delays instead of sleeping."""
+        import seh.utils.retry as retry_module
+
+        delays: list[float] = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+
+        monkeypatch.setattr(retry_module.asyncio, "sleep", fake_sleep)
+        return delays
+
+    @pytest.mark.asyncio
+    async def test_429_waits_for_retry_after(self, test_settings, sleeps):
+        """Test 429 responses are retried after the server-provided delay."""
+        client = SolarEdgeClient(test_settings)
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "7"}, content=b"slow down"),
+            httpx.Response(200, content=b'{"details": {}}'),
+        ]
+
+        client._client = httpx.AsyncClient(
+            base_url=test_settings.api_base_url,
+            transport=httpx.MockTransport(lambda request: responses.pop(0)),
+        )
+        try:
+            data = await client._request("GET", "/site/12345/details")
+        finally:
+            await client._client.aclose()
+
+        assert data == {"details": {}}
+        assert sleeps == [7.0]
+
+    @pytest.mark.asyncio
+    async def test_server_errors_retried_with_jitter(self, test_settings, sleeps):
+        """Test 5xx responses are retried with jittered exponential backoff."""
+        client = SolarEdgeClient(test_settings)
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(503, content=b"<html>unavailable</html>")
+
+        client._client = httpx.AsyncClient(
+            base_url=test_settings.api_base_url,
+            transport=httpx.MockTransport(handler),
+        )
+        try:
+            with pytest.raises(APIError):
+                await client._request("GET", "/site/12345/details")
+        finally:
+            await client._client.aclose()
+
+        assert len(calls) == 4
+        for attempt, delay in enumerate(sleeps):
+            assert 0.8 * 2.0 * 2**attempt <= delay <= 1.2 * 2.0 * 2**attempt
+
+    @pytest.mark.asyncio
+    async def test_client_errors_not_retried(self, test_settings, sleeps):
+        """Test 4xx responses other than 429 fail without retrying."""
+        client = SolarEdgeClient(test_settings)
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(404, content=b"not found")
+
+        client._client = httpx.AsyncClient(
+            base_url=test_settings.api_base_url,
+            transport=httpx.MockTransport(handler),
+        )
+        try:
+            with pytest.raises(APIError) as exc_info:
+                await client._request("GET", "/site/12345/details")
+        finally:
+            await client._client.aclose()
+
+        assert exc_info.value.status_code == 404
+        assert len(calls) == 1
+        assert sleeps == []
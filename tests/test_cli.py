@@ -0,0 +1,44 @@
+"""Tests for CLI helpers."""
+
+import pytest
+
+from seh.cli import _MAX_SITE_RANGE, parse_site_ids
+
+
+class TestParseSiteIds:
+    """Test parse_site_ids."""
+
+    def test_ids_and_ranges(self):
+        """Test single IDs and inclusive ranges are expanded in order."""
+        assert parse_site_ids("2000, 1000-1003 ,5") == [2000, 1000, 1001, 1002, 1003, 5]
+
+    def test_empty(self):
+        """Test no value or only separators means no filter."""
+        assert parse_site_ids(None) is None
+        assert parse_site_ids("") is None
+        assert parse_site_ids(" , ") is None
+
+    def test_single_id_range(self):
+        """Test a range whose ends match yields one ID."""
+        assert parse_site_ids("7-7") == [7]
+
+    @pytest.mark.parametrize("value", ["abc", "1,x", "1-", "-5", "1-2-3", "1.5"])
+    def test_bad_input(self, value):
+        """Test malformed entries exit with an error."""
+        with pytest.raises(SystemExit) as exc:
+            parse_site_ids(value)
+        assert exc.value.code == 1
+
+    def test_reversed_range(self):
+        """Test a descending range is rejected rather than read as no filter."""
+        with pytest.raises(SystemExit) as exc:
+            parse_site_ids("1010-1000")
+        assert exc.value.code == 1
+
+    def test_range_width_capped(self):
+        """Test ranges wider than _MAX_SITE_RANGE are rejected."""
+        assert len(parse_site_ids(f"1-{_MAX_SITE_RANGE}") or []) == _MAX_SITE_RANGE
+        with pytest.raises(SystemExit):
+            parse_site_ids(f"1-{_MAX_SITE_RANGE + 1}")
+        with pytest.raises(SystemExit):
+            parse_site_ids("1-999999999")
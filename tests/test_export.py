@@ -0,0 +1,165 @@
+"""Tests for export writers."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from seh.db.models.power import PowerReading
+
+
+class TestStreamOutput:
+    """Test stream_output."""
+
+    def test_parquet_column_null_in_first_batch(self, tmp_path, monkeypatch):
+        """Test a column that is NULL throughout the first batch keeps its type."""
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        from seh import cli
+
+        monkeypatch.setattr(cli, "_PARQUET_BATCH_SIZE", 2)
+        rows = [(1, "2024-06-01T00:00:00", 0.0, None)] * 2 + [(1, "2024-06-01T00:15:00", 1500.0, 1.5)]
+        output = tmp_path / "power.parquet"
+
+        cli.stream_output(
+            ("site_id", "timestamp", "power_watts", "power_kw"),
+            rows,
+            str(output),
+            "parquet",
+            "power",
+            types=(int, str, float, float),
+        )
+
+        table = pq.read_table(output)
+        assert str(table.schema.field("power_kw").type) == "double"
+        assert table.column("power_kw").to_pylist() == [None, None, 1.5]
+
+
+class TestCopyCsv:
+    """Test PostgreSQL COPY exports."""
+
+    @staticmethod
+    def _engine(chunks: list[bytes], rowcount: int) -> tuple[MagicMock, MagicMock]:
+        """Build a mock psycopg engine whose COPY yields the given chunks."""
+        engine = MagicMock()
+        engine.dialect = postgresql.dialect()
+        conn = engine.connect.return_value.__enter__.return_value
+        cursor = conn.connection.driver_connection.cursor.return_value.__enter__.return_value
+        cursor.copy.return_value.__enter__.return_value = iter(chunks)
+        cursor.rowcount = rowcount
+        return engine, cursor
+
+    def test_copy_sql_and_output(self, tmp_path):
+        """Test the query is inlined into COPY and the data written as it arrives."""
+        from seh.cli import _copy_csv
+
+        engine, cursor = self._engine([b"site_id,power_watts\r\n", b"1,100.0\r\n"], rowcount=1)
+        stmt = select(PowerReading.site_id, PowerReading.power_watts).where(
+            PowerReading.site_id.in_([1, 2])
+        )
+        output = tmp_path / "power.csv"
+
+        _copy_csv(engine, stmt, str(output), "power")
+
+        sql = cursor.copy.call_args.args[0]
+        assert sql.startswith("COPY (SELECT seh_power_readings.site_id")
+        assert "IN (1, 2)" in sql
+        assert sql.endswith(") TO STDOUT WITH (FORMAT csv, HEADER)")
+        assert output.read_bytes() == b"site_id,power_watts\r\n1,100.0\r\n"
+
+    def test_no_rows_removes_file(self, tmp_path):
+        """Test an empty result leaves no output file behind."""
+        from seh.cli import _copy_csv
+
+        engine, _ = self._engine([b"site_id\r\n"], rowcount=0)
+        output = tmp_path / "power.csv"
+
+        _copy_csv(engine, select(PowerReading.site_id), str(output), "power")
+
+        assert not output.exists()
+
+    def test_other_databases_stream_rows(self, test_engine, tmp_path):
+        """Test non-PostgreSQL databases fall back to streaming rows."""
+        from seh.cli import _export_rows
+
+        copy_stmt = MagicMock()
+        output = tmp_path / "power.csv"
+
+        _export_rows(
+            test_engine,
+            [1],
+            1,
+            ("site_id", "power_watts"),
+            (int, float),
+            lambda session, site_ids: iter([(1, 100.0)]),
+            str(output),
+            "csv",
+            "power",
+            copy_stmt=copy_stmt,
+        )
+
+        copy_stmt.assert_not_called()
+        assert output.read_text().splitlines() == ["site_id,power_watts", "1,100.0"]
+
+    def test_rows_without_site_skipped(self, test_engine, test_session, tmp_path):
+        """Test readings whose site is missing are dropped, as COPY's join drops them."""
+        from datetime import datetime
+
+        from click.testing import CliRunner
+
+        from seh.cli import export
+        from seh.db.models.site import Site
+
+        test_session.add(Site(id=1, name="Home"))
+        test_session.add_all([
+            PowerReading(site_id=site_id, timestamp=datetime(2024, 6, 1), power_watts=100.0)
+            for site_id in (1, 2)
+        ])
+        test_session.commit()
+        output = tmp_path / "power.csv"
+
+        result = CliRunner().invoke(
+            export, ["power", "-o", str(output)], obj={"engine": test_engine}
+        )
+
+        assert result.exit_code == 0, result.output
+        assert output.read_text().splitlines() == [
+            "site_id,site_name,timestamp,power_watts,power_kw",
+            "1,Home,2024-06-01T00:00:00,100.0,0.1",
+        ]
+
+
+class TestParallelExport:
+    """Test --parallel CSV exports."""
+
+    def test_parts_removed_when_a_group_fails(self, test_engine, tmp_path, monkeypatch):
+        """Test temporary parts are deleted when one worker raises."""
+        import tempfile
+
+        from seh.cli import _export_rows
+
+        parts_dir = tmp_path / "parts"
+        parts_dir.mkdir()
+        monkeypatch.setattr(tempfile, "tempdir", str(parts_dir))
+
+        def rows_for(session, site_ids):
+            if site_ids == [2]:
+                raise RuntimeError("query failed")
+            return iter([(site_ids[0], 100.0)])
+
+        with pytest.raises(RuntimeError, match="query failed"):
+            _export_rows(
+                test_engine,
+                [1, 2, 3],
+                3,
+                ("site_id", "power_watts"),
+                (int, float),
+                rows_for,
+                str(tmp_path / "power.csv"),
+                "csv",
+                "power",
+            )
+
+        assert list(parts_dir.iterdir()) == []
+        assert not (tmp_path / "power.csv").exists()
@@ -270,3 +270,28 @@ class TestCascadeDelete:
         # Verify related records are deleted
         assert test_session.query(Equipment).filter_by(serial_number="CASCADE_SN").first() is None
         assert test_session.query(EnergyReading).filter_by(site_id=99999).first() is None
+
+
+class TestExportIndexes:
+    """Test the time-series unique constraints serve the export sort order."""
+
+    @pytest.mark.parametrize(
+        "model, order_by",
+        [
+            (PowerReading, ("site_id", "timestamp")),
+            (EnergyReading, ("site_id", "reading_date")),
+            (InverterTelemetry, ("site_id", "serial_number", "timestamp")),
+        ],
+    )
+    def test_export_order_uses_index(self, test_engine, model, order_by):
+        """Test exports scan the composite index instead of sorting."""
+        from sqlalchemy import select, text
+
+        stmt = select(model).order_by(*(getattr(model, column) for column in order_by))
+        sql = str(stmt.compile(test_engine, compile_kwargs={"literal_binds": True}))
+
+        with test_engine.connect() as conn:
+            plan = " ".join(row[-1] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+
+        assert "USING INDEX" in plan
+        assert "TEMP B-TREE" not in plan
@@ -37,6 +37,23 @@ class TestSiteRepository:
         sites = repo.get_all()
         assert len(sites) == 2
 
+    def test_get_all_with_sync_metadata(self, test_session, sample_site_data):
+        """Test get_all_with_sync_metadata loads each site's metadata."""
+        test_session.add_all([Site(**sample_site_data), Site(id=12346, name="Site 2")])
+        test_session.commit()
+        SyncMetadataRepository(test_session).upsert(
+            site_id=12345,
+            data_type="energy",
+            last_sync_time=datetime(2024, 1, 15, 12, 0, 0),
+            records_synced=100,
+        )
+        test_session.expire_all()
+
+        sites = {site.id: site for site in SiteRepository(test_session).get_all_with_sync_metadata()}
+        assert "sync_metadata" in sites[12345].__dict__
+        assert [m.data_type for m in sites[12345].sync_metadata] == ["energy"]
+        assert sites[12346].sync_metadata == []
+
     def test_get_by_id(self, test_session, sample_site_data):
         """Test get_by_id returns correct site."""
         repo = SiteRepository(test_session)
@@ -182,6 +199,22 @@ class TestEnergyRepository:
         readings = repo.get_by_site_id(12345)
         assert len(readings) == 1
 
+    def test_upsert_batch_updates_existing(self, test_session, sample_site_data, sample_energy_data):
+        """Test upsert_batch overwrites existing rows and inserts new ones together."""
+        site = Site(**sample_site_data)
+        test_session.add(site)
+        test_session.commit()
+
+        repo = EnergyRepository(test_session)
+        repo.upsert_batch([sample_energy_data])
+
+        updated = {**sample_energy_data, "energy_wh": 30000.0}
+        new = {**sample_energy_data, "reading_date": date(2024, 1, 16), "energy_wh": 100.0}
+        assert repo.upsert_batch([updated, new]) == 2
+
+        readings = repo.get_by_site_id(12345)
+        assert [r.energy_wh for r in readings] == [30000.0, 100.0]
+
 
 class TestPowerRepository:
     """Test PowerRepository."""
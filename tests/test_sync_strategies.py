@@ -249,3 +249,35 @@ class TestBaseSyncStrategy:
         # Should be approximately 7 days ago
         days_ago = (datetime.now() - start_time).days
         assert 6 <= days_ago <= 8
+
+
+class TestSyncOrchestrator:
+    """Test SyncOrchestrator."""
+
+    @pytest.mark.asyncio
+    async def test_sync_sites_iter_yields_each_site(self, test_engine, test_settings):
+        """Test sites are synced in order and failures become results."""
+        from unittest.mock import patch
+
+        from seh.sync.orchestrator import SyncOrchestrator, SyncResult
+
+        client = AsyncMock()
+        client.get_sites.return_value = (
+            {"id": 1, "name": "First"},
+            {"id": 2, "name": "Second"},
+        )
+        orchestrator = SyncOrchestrator(client, test_engine, test_settings)
+
+        async def fake_sync_site(site_id, full=False):
+            if site_id == 2:
+                raise RuntimeError("boom")
+            return SyncResult(site_id, None, True, {"energy": 3}, {}, 0.1)
+
+        with patch.object(orchestrator, "sync_site", side_effect=fake_sync_site):
+            results = [r async for r in orchestrator.sync_sites_iter()]
+
+        assert [(r.site_id, r.site_name, r.success) for r in results] == [
+            (1, "First", True),
+            (2, "Second", False),
+        ]
+        assert results[1].errors == {"sync": "boom"}